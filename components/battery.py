@@ -1,6 +1,5 @@
 """This module contains definitions for different types of batteries."""
 
-from dataclasses import dataclass
 from typing import Optional
 from components.consumption import RechargeableBatteryConsumption, \
     return_rechargeable_battery_consumption
@@ -11,13 +10,14 @@ from simulation.constants import BATTERY_DEFAULT_SOH, BATTERY_EFFICIENCY_DEFAULT
     BATTERY_LiPo_ENERGY_DENSITY, BATTERY_NiCd_ENERGY_DENSITY, BATTERY_NiMH_ENERGY_DENSITY, \
     BATTERY_SOLID_STATE_ENERGY_DENSITY
 
-efficiency_default = return_rechargeable_battery_consumption(discharge_efficiency_func=lambda s: BATTERY_EFFICIENCY_DEFAULT,
-                                                             recharge_efficiency_func=lambda s: BATTERY_EFFICIENCY_DEFAULT)
+efficiency_default = return_rechargeable_battery_consumption(discharge_efficiency_func=BATTERY_EFFICIENCY_DEFAULT,
+                                                             recharge_efficiency_func=BATTERY_EFFICIENCY_DEFAULT)
 
 
-@dataclass
 class AlAirBattery(BatteryRechargeable):
     """Models an Aluminium Air battery."""
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  nominal_energy: float,
@@ -38,9 +38,10 @@ class AlAirBattery(BatteryRechargeable):
                          nominal_voltage=nominal_voltage)
 
 
-@dataclass
 class PbAcidBattery(BatteryRechargeable):
     """Models a lead-acid battery."""
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  nominal_energy: float,
@@ -61,9 +62,10 @@ class PbAcidBattery(BatteryRechargeable):
                          nominal_voltage=nominal_voltage)
 
 
-@dataclass
 class LiCoBattery(BatteryRechargeable):
     """Models a Lithium-ion Cobalt battery."""
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  nominal_energy: float,
@@ -84,9 +86,10 @@ class LiCoBattery(BatteryRechargeable):
                          nominal_voltage=nominal_voltage)
 
 
-@dataclass
 class LiMnBattery(BatteryRechargeable):
     """Models a Lithium-ion Manganese battery."""
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  nominal_energy: float,
@@ -107,9 +110,10 @@ class LiMnBattery(BatteryRechargeable):
                          nominal_voltage=nominal_voltage)
 
 
-@dataclass
 class LiPhBattery(BatteryRechargeable):
     """Models a Lithium-ion Phosphate battery."""
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  nominal_energy: float,
@@ -130,9 +134,10 @@ class LiPhBattery(BatteryRechargeable):
                          nominal_voltage=nominal_voltage)
 
 
-@dataclass
 class LiPoBattery(BatteryRechargeable):
     """Models a Lithium-ion Polymer battery."""
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  nominal_energy: float,
@@ -153,9 +158,10 @@ class LiPoBattery(BatteryRechargeable):
                          nominal_voltage=nominal_voltage)
 
 
-@dataclass
 class NiCdBattery(BatteryRechargeable):
     """Models a Nickel Cadmium battery."""
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  nominal_energy: float,
@@ -176,9 +182,10 @@ class NiCdBattery(BatteryRechargeable):
                          nominal_voltage=nominal_voltage)
 
 
-@dataclass
 class NiMHBattery(BatteryRechargeable):
     """Models a Nickel Metal Hydride battery."""
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  nominal_energy: float,
@@ -199,9 +206,10 @@ class NiMHBattery(BatteryRechargeable):
                          nominal_voltage=nominal_voltage)
 
 
-@dataclass
 class SolidStateBattery(BatteryRechargeable):
     """Models a Solid State battery."""
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  nominal_energy: float,
@@ -1,7 +1,98 @@
 """This module contains property curves for battery objects."""
 
 from typing import Callable
-from helpers.functions import assert_type_and_range
+import numpy as np
+from numpy.polynomial import Polynomial
+from numpy.typing import ArrayLike
+from helpers.functions import assert_type, assert_type_and_range, assert_callable
+
+TABULATED_CURVE_POINTS: int = 1025
+POLYNOMIAL_CURVE_DEGREE: int = 4
+
+
+def _lookup(table: list[float],
+            min_value: float,
+            max_value: float) -> Callable[[float], float]:
+    """
+    Returns a linear interpolation of `table`, sampled on a
+    uniform grid over [`min_value`, `max_value`].
+    Values outside the grid return 0.0.
+    """
+    table.append(table[-1])
+    inv_step = (len(table) - 2) / (max_value - min_value)
+    def interpolated(value: float) -> float:
+        if not min_value <= value <= max_value:
+            return 0.0
+        position = (value - min_value) * inv_step
+        index = int(position)
+        fraction = position - index
+        low = table[index]
+        return low + (table[index + 1] - low) * fraction
+    return interpolated
+
+
+def _tabulate(func: Callable[[float], float],
+              max_value: float,
+              points: int) -> Callable[[float], float]:
+    """
+    Samples `func` on a uniform grid over [0, `max_value`] and
+    returns a linear interpolation of the samples.
+    Values outside the grid return 0.0.
+    """
+    assert_callable(func)
+    assert_type_and_range(max_value,
+                          more_than=0.0,
+                          include_more=False)
+    assert_type(points,
+                expected_type=int)
+    assert points >= 2
+    step = max_value / (points - 1)
+    return _lookup(table=[func(i * step) for i in range(points)],
+                   min_value=0.0,
+                   max_value=max_value)
+
+
+def _piecewise_linear(xs: ArrayLike,
+                      ys: ArrayLike,
+                      points: int) -> Callable[[float], float]:
+    """
+    Resamples the piecewise linear curve through (`xs`, `ys`) on a
+    uniform grid over [`xs[0]`, `xs[-1]`] and returns a linear
+    interpolation of the samples.
+    Values outside the grid return 0.0.
+    """
+    xs = np.ascontiguousarray(xs, dtype=np.float64)
+    ys = np.ascontiguousarray(ys, dtype=np.float64)
+    assert xs.ndim == 1 and xs.shape == ys.shape and xs.size >= 2
+    assert xs[0] >= 0.0 and np.all(np.diff(xs) > 0.0)
+    assert_type(points,
+                expected_type=int)
+    assert points >= 2
+    grid = np.linspace(xs[0], xs[-1], points)
+    return _lookup(table=np.interp(grid, xs, ys).tolist(),
+                   min_value=float(xs[0]),
+                   max_value=float(xs[-1]))
+
+
+def _polynomial_fit(func: Callable[[float], float],
+                    max_value: float,
+                    degree: int,
+                    points: int) -> Polynomial:
+    """
+    Fits a polynomial of the given `degree` to `func`, sampled on a
+    uniform grid over [0, `max_value`].
+    The result accepts scalars or arrays and is
+    only meaningful inside the sampled range.
+    """
+    assert_callable(func)
+    assert_type_and_range(max_value,
+                          more_than=0.0,
+                          include_more=False)
+    assert_type(degree, points,
+                expected_type=int)
+    assert 0 <= degree < points
+    grid = np.linspace(0.0, max_value, points)
+    return Polynomial.fit(grid, [func(value) for value in grid.tolist()], deg=degree)
 
 
 class BatteryEfficiencyCurves():
@@ -27,6 +118,45 @@ class BatteryEfficiencyCurves():
             return 0.0
         return constant_efficiency
 
+    @staticmethod
+    def tabulated(efficiency_func: Callable[[float], float],
+                  max_power: float,
+                  points: int=TABULATED_CURVE_POINTS) -> Callable[[float], float]:
+        """
+        Precomputes `efficiency_func` over [0, `max_power`] and
+        returns a lookup table with linear interpolation.
+        """
+        return _tabulate(func=efficiency_func,
+                         max_value=max_power,
+                         points=points)
+
+    @staticmethod
+    def piecewise_linear(powers: ArrayLike,
+                         efficiencies: ArrayLike,
+                         points: int=TABULATED_CURVE_POINTS) -> Callable[[float], float]:
+        """
+        Returns the efficiency interpolated linearly between the
+        given (power, efficiency) points.
+        """
+        assert np.all((np.asarray(efficiencies) >= 0.0) & (np.asarray(efficiencies) <= 1.0))
+        return _piecewise_linear(xs=powers,
+                                 ys=efficiencies,
+                                 points=points)
+
+    @staticmethod
+    def polynomial(efficiency_func: Callable[[float], float],
+                   max_power: float,
+                   degree: int=POLYNOMIAL_CURVE_DEGREE,
+                   points: int=TABULATED_CURVE_POINTS) -> Polynomial:
+        """
+        Fits `efficiency_func` over [0, `max_power`] with a
+        polynomial that can be evaluated on whole arrays of power.
+        """
+        return _polynomial_fit(func=efficiency_func,
+                               max_value=max_power,
+                               degree=degree,
+                               points=points)
+
 
 class BatteryVoltageVSCurrent():
     """
@@ -46,3 +176,42 @@ class BatteryVoltageVSCurrent():
                 return voltage
             return 0.0
         return voltage_vs_current
+
+    @staticmethod
+    def tabulated(voltage_func: Callable[[float], float],
+                  max_current: float,
+                  points: int=TABULATED_CURVE_POINTS) -> Callable[[float], float]:
+        """
+        Precomputes `voltage_func` over [0, `max_current`] and
+        returns a lookup table with linear interpolation.
+        """
+        return _tabulate(func=voltage_func,
+                         max_value=max_current,
+                         points=points)
+
+    @staticmethod
+    def piecewise_linear(currents: ArrayLike,
+                         voltages: ArrayLike,
+                         points: int=TABULATED_CURVE_POINTS) -> Callable[[float], float]:
+        """
+        Returns the voltage interpolated linearly between the
+        given (current, voltage) points.
+        """
+        assert np.all(np.asarray(voltages) >= 0.0)
+        return _piecewise_linear(xs=currents,
+                                 ys=voltages,
+                                 points=points)
+
+    @staticmethod
+    def polynomial(voltage_func: Callable[[float], float],
+                   max_current: float,
+                   degree: int=POLYNOMIAL_CURVE_DEGREE,
+                   points: int=TABULATED_CURVE_POINTS) -> Polynomial:
+        """
+        Fits `voltage_func` over [0, `max_current`] with a
+        polynomial that can be evaluated on whole arrays of current.
+        """
+        return _polynomial_fit(func=voltage_func,
+                               max_value=max_current,
+                               degree=degree,
+                               points=points)
@@ -3,7 +3,9 @@ This module contains definitions for mechanical braking systems.
 """
 
 from dataclasses import dataclass, field
-from uuid import uuid4
+from itertools import count
+
+_ID_COUNTER = count()
 
 
 @dataclass
@@ -15,7 +17,7 @@ class Brake():
     name: str
 
     def __post_init__(self):
-        self.id = f"Brake-{uuid4()}"
+        self.id = f"Brake-{next(_ID_COUNTER)}"
 
 
 @dataclass
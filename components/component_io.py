@@ -8,7 +8,7 @@ from components.fuel_type import LiquidFuel, GaseousFuel
 # ========
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricIO():
     """
     Describes an electric input or output.
@@ -16,7 +16,7 @@ class ElectricIO():
     electric_power: float=0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MechanicalIO():
     """
     Describes a mechanical input or output.
@@ -24,7 +24,7 @@ class MechanicalIO():
     torque: float=0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidFuelIO():
     """
     Describes a liquid fuel input or output.
@@ -33,7 +33,7 @@ class LiquidFuelIO():
     liters_flow: float=0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GaseousFuelIO():
     """
     Describes a gaseous fuel input or output.
@@ -47,14 +47,14 @@ class GaseousFuelIO():
 # ===============
 
 
-@dataclass
+@dataclass(slots=True)
 class ConverterIO():
     """
     Base class for converters' inputs and outputs.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricMotorIO(ConverterIO):
     """
     Describes an electric motor's input and output.
@@ -63,7 +63,7 @@ class ElectricMotorIO(ConverterIO):
     output_port: MechanicalIO
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidInternalCombustionEngineIO(ConverterIO):
     """
     Describes a liquid fuel internal
@@ -73,7 +73,7 @@ class LiquidInternalCombustionEngineIO(ConverterIO):
     output_port: MechanicalIO
 
 
-@dataclass
+@dataclass(slots=True)
 class GaseousInternalCombustionEngineIO(ConverterIO):
     """
     Describes a gaseous fuel internal
@@ -83,7 +83,7 @@ class GaseousInternalCombustionEngineIO(ConverterIO):
     output_port: MechanicalIO
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricGeneratorIO(ConverterIO):
     """
     Describes an electric generator's input and output.
@@ -92,7 +92,7 @@ class ElectricGeneratorIO(ConverterIO):
     output_port: ElectricIO
 
 
-@dataclass
+@dataclass(slots=True)
 class FuelCellIO(ConverterIO):
     """
     Describes a fuel cell's input and output.
@@ -101,7 +101,7 @@ class FuelCellIO(ConverterIO):
     output_port: ElectricIO
 
 
-@dataclass
+@dataclass(slots=True)
 class PureElectricIO(ConverterIO):
     """
     Describes the input and output
@@ -111,7 +111,7 @@ class PureElectricIO(ConverterIO):
     output_port: ElectricIO
 
 
-@dataclass
+@dataclass(slots=True)
 class PureMechanicalIO(ConverterIO):
     """
     Describes the input and output
@@ -121,21 +121,21 @@ class PureMechanicalIO(ConverterIO):
     output_port: MechanicalIO
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricInverterIO(PureElectricIO):
     """
     Describes an electric inverter's input and output.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricRectifierIO(PureElectricIO):
     """
     Describes an electric rectifier's input and output.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class GearBoxIO(PureMechanicalIO):
     """
     Describes a gearbox's input and output.
@@ -147,28 +147,28 @@ class GearBoxIO(PureMechanicalIO):
 # ===================
 
 
-@dataclass
+@dataclass(slots=True)
 class EnergySourceIO():
     """
     Base class for an energy source's input and output.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryIO(EnergySourceIO):
     """
     Base class for a battery's input and output.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class FuelTankIO(EnergySourceIO):
     """
     Base class for a fuel tank's output.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class NonRechargeableBatteryIO(BatteryIO):
     """
     Describes a non rechargeable battery's output.
@@ -176,7 +176,7 @@ class NonRechargeableBatteryIO(BatteryIO):
     output_port: ElectricIO
 
 
-@dataclass
+@dataclass(slots=True)
 class RechargeableBatteryIO(NonRechargeableBatteryIO):
     """
     Describes a rechargeable battery's input and output.
@@ -184,7 +184,7 @@ class RechargeableBatteryIO(NonRechargeableBatteryIO):
     input_port: ElectricIO
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidFuelTankIO(FuelTankIO):
     """
     Describes a liquid fuel tank's output.
@@ -192,7 +192,7 @@ class LiquidFuelTankIO(FuelTankIO):
     output_port: LiquidFuelIO
 
 
-@dataclass
+@dataclass(slots=True)
 class GaseousFuelTankIO(FuelTankIO):
     """
     Describes a gaseous fuel tank's output.
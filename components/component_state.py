@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from simulation.constants import DEFAULT_TEMPERATURE
 
 
-@dataclass
+@dataclass(slots=True)
 class RotatingState():
     """
     Defines a rotating mechanical state variable.
@@ -12,7 +12,7 @@ class RotatingState():
     rpm: float=0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseInternalState():
     """
     Defines the internal state of any component.
@@ -20,7 +20,7 @@ class BaseInternalState():
     temperature: float=DEFAULT_TEMPERATURE
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryInternalState(BaseInternalState):
     """
     Defines a battery state variable.
@@ -28,7 +28,7 @@ class BatteryInternalState(BaseInternalState):
     electric_energy_stored: float=0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidFuelTankInternalState(BaseInternalState):
     """
     Defines a liquid fuel tank state variable.
@@ -36,7 +36,7 @@ class LiquidFuelTankInternalState(BaseInternalState):
     liters_stored: float=0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class GaseousFuelTankInternalState(BaseInternalState):
     """
     Defines a gaseous fuel tank state variable.
@@ -44,7 +44,7 @@ class GaseousFuelTankInternalState(BaseInternalState):
     mass_stored: float=0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MotorInternalState(BaseInternalState):
     """
     Defines the internal state of a motor or engine.
@@ -52,35 +52,35 @@ class MotorInternalState(BaseInternalState):
     on: bool=True
 
 
-@dataclass
+@dataclass(slots=True)
 class FuelCellInternalState(BaseInternalState):
     """
     Defines the internal state of a fuel cell.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class PureElectricInternalState(BaseInternalState):
     """
     Defines the internal state of a pure electric component.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class PureMechanicalInternalState(BaseInternalState):
     """
     Defines the internal state of a pure mechanical component.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class ConverterState():
     """
     Base class for a converter's state.
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricMotorState(ConverterState):
     """
     Defines the state variable of an electric motor.
@@ -89,7 +89,7 @@ class ElectricMotorState(ConverterState):
     output_port: RotatingState
 
 
-@dataclass
+@dataclass(slots=True)
 class InternalCombustionEngineState(ConverterState):
     """
     Defines the state variable of an internal combustion engine.
@@ -98,7 +98,7 @@ class InternalCombustionEngineState(ConverterState):
     output_port: RotatingState
 
 
-@dataclass
+@dataclass(slots=True)
 class FuelCellState(ConverterState):
     """
     Defines the state variable of a fuel cell.
@@ -106,7 +106,7 @@ class FuelCellState(ConverterState):
     internal: FuelCellInternalState
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricGeneratorState(ConverterState):
     """
     Defines the state variable of an electric generator.
@@ -115,7 +115,7 @@ class ElectricGeneratorState(ConverterState):
     internal: BaseInternalState
 
 
-@dataclass
+@dataclass(slots=True)
 class PureMechanicalState(ConverterState):
     """
     Defines the state variable of a pure mechanical component.
@@ -125,7 +125,7 @@ class PureMechanicalState(ConverterState):
     output_port: RotatingState
 
 
-@dataclass
+@dataclass(slots=True)
 class PureElectricState(ConverterState):
     """
     Defines the state variable of a pure electric component.
@@ -133,7 +133,7 @@ class PureElectricState(ConverterState):
     internal: PureElectricInternalState
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryState():
     """
     Defines a battery's state variable.
@@ -141,7 +141,7 @@ class BatteryState():
     internal: BatteryInternalState
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidFuelTankState():
     """
     Defines a liquid fuel tank's state variable.
@@ -149,7 +149,7 @@ class LiquidFuelTankState():
     internal: LiquidFuelTankInternalState
 
 
-@dataclass
+@dataclass(slots=True)
 class GaseousFuelTankState():
     """
     Defines a gaseous fuel tank's state variable.
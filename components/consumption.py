@@ -29,6 +29,19 @@ InFuelSnapshot = TypeVar("InFuelSnapshot",
                                FuelCellSnapshot)
 
 
+def _assert_efficiency(efficiency: Callable[..., float]|float) -> None:
+    """
+    Asserts that `efficiency` is either a function
+    of the state or a constant value in (0, 1].
+    """
+    if callable(efficiency):
+        return
+    assert_type_and_range(efficiency,
+                          more_than=0.0,
+                          less_than=1.0,
+                          include_more=False)
+
+
 @dataclass
 class InternalToOutEnergyConsumption(Generic[InternalToOutSnapshot]):
     """
@@ -37,10 +50,10 @@ class InternalToOutEnergyConsumption(Generic[InternalToOutSnapshot]):
     Applies to components that store their
     own energy (batteries and others).
     """
-    internal_to_out_efficiency_func: Callable[[InternalToOutSnapshot], float]
+    internal_to_out_efficiency_func: Callable[[InternalToOutSnapshot], float]|float
 
     def __post_init__(self):
-        assert_callable(self.internal_to_out_efficiency_func)
+        _assert_efficiency(self.internal_to_out_efficiency_func)
 
     def compute_internal_to_out(self, snap: InternalToOutSnapshot,
                                 delta_t: float) -> float:
@@ -48,19 +61,24 @@ class InternalToOutEnergyConsumption(Generic[InternalToOutSnapshot]):
         Calculates energy consumption from internal
         source being delivered to the output.
         """
-        assert_type(snap,
-                    expected_type=(RechargeableBatterySnapshot, NonRechargeableBatterySnapshot))
-        assert_type_and_range(delta_t,
-                              more_than=0.0)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=(RechargeableBatterySnapshot, NonRechargeableBatterySnapshot))
+            assert_type_and_range(delta_t,
+                                  more_than=0.0)
         return snap.power_out * delta_t / self.internal_to_out_efficiency_value(snap=snap)
 
     def internal_to_out_efficiency_value(self, snap: InternalToOutSnapshot) -> float:
         """
         Returns the efficiency value at a given state.
         """
-        assert_type(snap,
-                    expected_type=(RechargeableBatterySnapshot, NonRechargeableBatterySnapshot))
-        return self.internal_to_out_efficiency_func(snap)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=(RechargeableBatterySnapshot, NonRechargeableBatterySnapshot))
+        efficiency = self.internal_to_out_efficiency_func
+        if not callable(efficiency):
+            return efficiency
+        return efficiency(snap)
 
 
 @dataclass
@@ -71,10 +89,10 @@ class OutToInternalEnergyConsumption():
     Applies to components that store their
     own energy (batteries and others).
     """
-    out_to_internal_efficiency_func: Callable[[RechargeableBatterySnapshot], float]
+    out_to_internal_efficiency_func: Callable[[RechargeableBatterySnapshot], float]|float
 
     def __post_init__(self):
-        assert_callable(self.out_to_internal_efficiency_func)
+        _assert_efficiency(self.out_to_internal_efficiency_func)
 
     def compute_out_to_internal(self, snap: RechargeableBatterySnapshot,
                                 delta_t: float) -> float:
@@ -82,29 +100,34 @@ class OutToInternalEnergyConsumption():
         Calculates reverse energy consumption from the
         output being delivered to the internal source.
         """
-        assert_type(snap,
-                    expected_type=RechargeableBatterySnapshot)
-        assert_type_and_range(delta_t,
-                              more_than=0.0)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=RechargeableBatterySnapshot)
+            assert_type_and_range(delta_t,
+                                  more_than=0.0)
         return snap.power_out * delta_t * self.out_to_internal_efficiency_value(snap=snap)
 
     def out_to_internal_efficiency_value(self, snap: RechargeableBatterySnapshot) -> float:
         """
         Returns the reverse efficiency value at a given state.
         """
-        assert_type(snap,
-                    expected_type=RechargeableBatterySnapshot)
-        return self.out_to_internal_efficiency_func(snap)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=RechargeableBatterySnapshot)
+        efficiency = self.out_to_internal_efficiency_func
+        if not callable(efficiency):
+            return efficiency
+        return efficiency(snap)
 
 
 @dataclass
 class InToInternalEnergyConsumption():
     """
     """
-    in_to_internal_efficiency_func: Callable[[RechargeableBatterySnapshot], float]
+    in_to_internal_efficiency_func: Callable[[RechargeableBatterySnapshot], float]|float
 
     def __post_init__(self):
-        assert_callable(self.in_to_internal_efficiency_func)
+        _assert_efficiency(self.in_to_internal_efficiency_func)
 
     def compute_in_to_internal(self, snap: RechargeableBatterySnapshot,
                                delta_t: float) -> float:
@@ -112,29 +135,34 @@ class InToInternalEnergyConsumption():
         Computes the energy consumption
         from the input to internal storage.
         """
-        assert_type(snap,
-                    expected_type=RechargeableBatterySnapshot)
-        assert_type_and_range(delta_t,
-                              more_than=0.0)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=RechargeableBatterySnapshot)
+            assert_type_and_range(delta_t,
+                                  more_than=0.0)
         return snap.power_in * delta_t * self.in_to_internal_efficiency_value(snap=snap)
 
     def in_to_internal_efficiency_value(self, snap: RechargeableBatterySnapshot) -> float:
         """
         Returns the reverse efficiency value at a given state.
         """
-        assert_type(snap,
-                    expected_type=RechargeableBatterySnapshot)
-        return self.in_to_internal_efficiency_func(snap)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=RechargeableBatterySnapshot)
+        efficiency = self.in_to_internal_efficiency_func
+        if not callable(efficiency):
+            return efficiency
+        return efficiency(snap)
 
 
 @dataclass
 class InternalToInEnergyConsumption():
     """
     """
-    internal_to_in_efficiency_func: Callable[[RechargeableBatterySnapshot], float]
+    internal_to_in_efficiency_func: Callable[[RechargeableBatterySnapshot], float]|float
 
     def __post_init__(self):
-        assert_callable(self.internal_to_in_efficiency_func)
+        _assert_efficiency(self.internal_to_in_efficiency_func)
 
     def compute_internal_to_in(self, snap: RechargeableBatterySnapshot,
                                delta_t: float) -> float:
@@ -142,29 +170,34 @@ class InternalToInEnergyConsumption():
         Computes the energy consumption from
         the internal storage to the input.
         """
-        assert_type(snap,
-                    expected_type=RechargeableBatterySnapshot)
-        assert_type_and_range(delta_t,
-                              more_than=0.0)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=RechargeableBatterySnapshot)
+            assert_type_and_range(delta_t,
+                                  more_than=0.0)
         return snap.power_in * delta_t / self.internal_to_in_efficiency_value(snap=snap)
 
     def internal_to_in_efficiency_value(self, snap: RechargeableBatterySnapshot) -> float:
         """
         Returns the reverse efficiency value at a given state.
         """
-        assert_type(snap,
-                    expected_type=RechargeableBatterySnapshot)
-        return self.internal_to_in_efficiency_func(snap)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=RechargeableBatterySnapshot)
+        efficiency = self.internal_to_in_efficiency_func
+        if not callable(efficiency):
+            return efficiency
+        return efficiency(snap)
 
 
 @dataclass
 class InToOutEnergyConsumption(Generic[InOutSnapshot]):
     """
     """
-    in_to_out_efficiency_func: Callable[[InOutSnapshot], float]
+    in_to_out_efficiency_func: Callable[[InOutSnapshot], float]|float
 
     def __post_init__(self):
-        assert_callable(self.in_to_out_efficiency_func)
+        _assert_efficiency(self.in_to_out_efficiency_func)
 
     def compute_in_to_out(self, snap: InOutSnapshot,
                           delta_t: float) -> float:
@@ -172,29 +205,34 @@ class InToOutEnergyConsumption(Generic[InOutSnapshot]):
         Computes the energy consumption
         from the input to the output.
         """
-        assert_type(snap,
-                    expected_type=(ConverterSnapshot, EnergySourceSnapshot))
-        assert_type_and_range(delta_t,
-                              more_than=0.0)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=(ConverterSnapshot, EnergySourceSnapshot))
+            assert_type_and_range(delta_t,
+                                  more_than=0.0)
         return snap.power_out * delta_t / self.in_to_out_efficiency_value(snap=snap)
 
     def in_to_out_efficiency_value(self, snap: InOutSnapshot) -> float:
         """
         Returns the reverse efficiency value at a given state.
         """
-        assert_type(snap,
-                    expected_type=(ConverterSnapshot, EnergySourceSnapshot))
-        return self.in_to_out_efficiency_func(snap)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=(ConverterSnapshot, EnergySourceSnapshot))
+        efficiency = self.in_to_out_efficiency_func
+        if not callable(efficiency):
+            return efficiency
+        return efficiency(snap)
 
 
 @dataclass
 class OutToInEnergyConsumption(Generic[InOutSnapshot]):
     """
     """
-    out_to_in_efficiency_func: Callable[[InOutSnapshot], float]
+    out_to_in_efficiency_func: Callable[[InOutSnapshot], float]|float
 
     def __post_init__(self):
-        assert_callable(self.out_to_in_efficiency_func)
+        _assert_efficiency(self.out_to_in_efficiency_func)
 
     def compute_out_to_in(self, snap: InOutSnapshot,
                           delta_t: float) -> float:
@@ -202,19 +240,24 @@ class OutToInEnergyConsumption(Generic[InOutSnapshot]):
         Computes the energy consumption
         from the output to the input.
         """
-        assert_type(snap,
-                    expected_type=(ConverterSnapshot, EnergySourceSnapshot))
-        assert_type_and_range(delta_t,
-                              more_than=0.0)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=(ConverterSnapshot, EnergySourceSnapshot))
+            assert_type_and_range(delta_t,
+                                  more_than=0.0)
         return snap.power_in * delta_t / self.out_to_in_efficiency_value(snap=snap)
 
     def out_to_in_efficiency_value(self, snap: InOutSnapshot) -> float:
         """
         Returns the reverse efficiency value at a given state.
         """
-        assert_type(snap,
-                    expected_type=(ConverterSnapshot, EnergySourceSnapshot))
-        return self.out_to_in_efficiency_func(snap)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=(ConverterSnapshot, EnergySourceSnapshot))
+        efficiency = self.out_to_in_efficiency_func
+        if not callable(efficiency):
+            return efficiency
+        return efficiency(snap)
 
 
 @dataclass
@@ -232,18 +275,20 @@ class InternalToOutFuelConsumption(Generic[FuelTankSnapshot]):
         Calculates the fuel transfered from
         internal storage to the output.
         """
-        assert_type(snap,
-                    expected_type=(LiquidFuelTankSnapshot, GaseousFuelTankSnapshot))
-        assert_type_and_range(delta_t,
-                              more_than=0.0)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=(LiquidFuelTankSnapshot, GaseousFuelTankSnapshot))
+            assert_type_and_range(delta_t,
+                                  more_than=0.0)
         return self.internal_to_out_fuel_consumption_value(snap) * delta_t
 
     def internal_to_out_fuel_consumption_value(self, snap: FuelTankSnapshot) -> float:
         """
         Returns the marginal fuel consumption at a given state.
         """
-        assert_type(snap,
-                    expected_type=(LiquidFuelTankSnapshot, GaseousFuelTankSnapshot))
+        if __debug__:
+            assert_type(snap,
+                        expected_type=(LiquidFuelTankSnapshot, GaseousFuelTankSnapshot))
         return self.internal_to_out_fuel_consumption_func(snap)
 
 
@@ -262,22 +307,24 @@ class InToOutFuelConsumption(Generic[InFuelSnapshot]):
         Calculates the fuel consumed
         from input to generate an output.
         """
-        assert_type(snap,
-                    expected_type=(LiquidCombustionEngineSnapshot,
-                                   GaseousCombustionEngineSnapshot,
-                                   FuelCellSnapshot))
-        assert_type_and_range(delta_t,
-                              more_than=0.0)
+        if __debug__:
+            assert_type(snap,
+                        expected_type=(LiquidCombustionEngineSnapshot,
+                                       GaseousCombustionEngineSnapshot,
+                                       FuelCellSnapshot))
+            assert_type_and_range(delta_t,
+                                  more_than=0.0)
         return self.in_to_out_fuel_consumption_value(snap) * delta_t
 
     def in_to_out_fuel_consumption_value(self, snap: InFuelSnapshot) -> float:
         """
         Returns the marginal fuel consumption at a given state.
         """
-        assert_type(snap,
-                    expected_type=(LiquidCombustionEngineSnapshot,
-                                   GaseousCombustionEngineSnapshot,
-                                   FuelCellSnapshot))
+        if __debug__:
+            assert_type(snap,
+                        expected_type=(LiquidCombustionEngineSnapshot,
+                                       GaseousCombustionEngineSnapshot,
+                                       FuelCellSnapshot))
         return self.in_to_out_fuel_consumption_func(snap)
 
 
@@ -418,9 +465,9 @@ class GaseousFuelTankConsumption(EnergySourceConsumption,
 
 def return_rechargeable_battery_consumption(
         discharge_efficiency_func: Callable[
-            [RechargeableBatterySnapshot], float],
+            [RechargeableBatterySnapshot], float]|float,
         recharge_efficiency_func: Callable[
-            [RechargeableBatterySnapshot], float]
+            [RechargeableBatterySnapshot], float]|float
         ) -> RechargeableBatteryConsumption:
     return RechargeableBatteryConsumption(
         in_to_internal_efficiency_func=recharge_efficiency_func,
@@ -431,15 +478,15 @@ def return_rechargeable_battery_consumption(
 
 def return_non_rechargeable_battery_consumption(
         discharge_efficiency_func: Callable[
-            [NonRechargeableBatterySnapshot], float],
+            [NonRechargeableBatterySnapshot], float]|float,
         ) -> NonRechargeableBatteryConsumption:
     return NonRechargeableBatteryConsumption(
         internal_to_out_efficiency_func=discharge_efficiency_func
     )
 
 def return_electric_motor_consumption(
-        motor_efficiency_func: Callable[[ElectricMotorSnapshot], float],
-        generator_efficiency_func: Callable[[ElectricMotorSnapshot], float]
+        motor_efficiency_func: Callable[[ElectricMotorSnapshot], float]|float,
+        generator_efficiency_func: Callable[[ElectricMotorSnapshot], float]|float
         ) -> ElectricMotorConsumption:
     return ElectricMotorConsumption(
         in_to_out_efficiency_func=motor_efficiency_func,
@@ -447,7 +494,7 @@ def return_electric_motor_consumption(
     )
 
 def return_electric_generator_consumption(
-        generator_efficiency_func: Callable[[ElectricGeneratorSnapshot], float]
+        generator_efficiency_func: Callable[[ElectricGeneratorSnapshot], float]|float
         ) -> ElectricGeneratorConsumption:
     return ElectricGeneratorConsumption(
         in_to_out_efficiency_func=generator_efficiency_func
@@ -475,8 +522,8 @@ def return_fuel_cell_consumption(
     )
 
 def return_gearbox_consumption(
-        efficiency_func: Callable[[GearBoxSnapshot], float],
-        reverse_efficiency_func: Callable[[GearBoxSnapshot], float]
+        efficiency_func: Callable[[GearBoxSnapshot], float]|float,
+        reverse_efficiency_func: Callable[[GearBoxSnapshot], float]|float
         ) -> GearBoxConsumption:
     return GearBoxConsumption(
         in_to_out_efficiency_func=efficiency_func,
@@ -484,14 +531,14 @@ def return_gearbox_consumption(
     )
 
 def return_electric_inverter_consumption(
-    efficiency_func: Callable[[ElectricInverterSnapshot], float]
+    efficiency_func: Callable[[ElectricInverterSnapshot], float]|float
     ) -> ElectricInverterConsumption:
     return ElectricInverterConsumption(
         in_to_out_efficiency_func=efficiency_func
     )
 
 def return_electric_rectifier_consumption(
-    efficiency_func: Callable[[ElectricRectifierSnapshot], float]
+    efficiency_func: Callable[[ElectricRectifierSnapshot], float]|float
     ) -> ElectricRectifierConsumption:
     return ElectricRectifierConsumption(
         in_to_out_efficiency_func=efficiency_func
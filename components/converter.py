@@ -1,9 +1,9 @@
 """This module contains definitions for energy conversion modules."""
 
 from abc import ABC
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
-from uuid import uuid4
+from itertools import count
 from components.component_snapshot import ConverterSnapshot
 from components.consumption import ConverterConsumption
 from components.dynamic_response import BaseDynamicResponse
@@ -12,8 +12,10 @@ from components.port import Port, PortInput, PortOutput, \
     PortBidirectional, PortType, PortDirection
 from helpers.functions import assert_type, assert_type_and_range
 
+_ID_COUNTER = count()
 
-@dataclass
+
+@dataclass(eq=False)
 class Converter(ABC):
     """
     Base class for modules that convert energy between types.
@@ -35,7 +37,8 @@ class Converter(ABC):
         - `reverse_efficiency` (float or None): allows to convert
                 power [0.0-1.0] in reverse if the value is not None
     """
-    id: str=field(init=False)
+    __slots__ = ("name", "mass", "input", "output", "snapshot", "limits",
+                 "consumption", "dynamic_response", "id", "_ports")
     name: str
     mass: float
     input: PortInput|PortBidirectional
@@ -46,27 +49,30 @@ class Converter(ABC):
     dynamic_response: BaseDynamicResponse
 
     def __post_init__(self):
-        assert_type(self.name,
-                    expected_type=str)
-        assert_type(self.input,
-                    expected_type=(PortInput, PortBidirectional))
-        assert_type(self.output,
-                    expected_type=(PortOutput, PortBidirectional))
-        assert_type(self.snapshot,
-                    expected_type=ConverterSnapshot)
-        assert_type_and_range(self.mass,
-                              more_than=0.0)
-        assert_type(self.limits,
-                    expected_type=ConverterLimits)
-        assert_type(self.consumption,
-                    expected_type=ConverterConsumption)
-        assert PortDirection.BIDIRECTIONAL not in (self.input.direction,
-                                                   self.output.direction) and \
-            self.input.direction!=self.output.direction or \
-            self.input.direction==PortDirection.BIDIRECTIONAL==self.output.direction
-        assert_type(self.dynamic_response,
-                    expected_type=BaseDynamicResponse)
-        self.id = f"Converter-{uuid4()}"
+        if __debug__:
+            assert_type(self.name,
+                        expected_type=str)
+            assert_type(self.input,
+                        expected_type=(PortInput, PortBidirectional))
+            assert_type(self.output,
+                        expected_type=(PortOutput, PortBidirectional))
+            assert_type(self.snapshot,
+                        expected_type=ConverterSnapshot)
+            assert_type_and_range(self.mass,
+                                  more_than=0.0)
+            assert_type(self.limits,
+                        expected_type=ConverterLimits)
+            assert_type(self.consumption,
+                        expected_type=ConverterConsumption)
+            assert PortDirection.BIDIRECTIONAL not in (self.input.direction,
+                                                       self.output.direction) and \
+                self.input.direction!=self.output.direction or \
+                self.input.direction==PortDirection.BIDIRECTIONAL==self.output.direction
+            assert_type(self.dynamic_response,
+                        expected_type=BaseDynamicResponse)
+        self._ports = {PortType.INPUT_PORT: self.input,
+                       PortType.OUTPUT_PORT: self.output}
+        self.id = f"Converter-{next(_ID_COUNTER)}"
 
     @property
     def reversible(self) -> bool:
@@ -93,11 +99,10 @@ class Converter(ABC):
         """
         Returns the requested Port object.
         """
-        assert_type(which,
-                    expected_type=PortType)
-        if which==PortType.INPUT_PORT:
-            return self.input
-        return self.output
+        if __debug__:
+            assert_type(which,
+                        expected_type=PortType)
+        return self._ports[which]
 
     def return_which_port(self, port: PortInput|PortOutput|PortBidirectional) -> Optional[PortType]:
         """
@@ -124,7 +129,7 @@ class Converter(ABC):
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(eq=False)
 class MechanicalConverter(Converter):
     """
     Models a mechanical converter, which involves movement.
@@ -134,5 +139,6 @@ class MechanicalConverter(Converter):
 
     def __post_init__(self):
         super().__post_init__()
-        assert_type_and_range(self.inertia,
-                              more_than=0.0)
+        if __debug__:
+            assert_type_and_range(self.inertia,
+                                  more_than=0.0)
@@ -96,7 +96,7 @@ class Axle():
         return self._num_wheels
 
 
-@dataclass
+@dataclass(eq=False)
 class Differential(MechanicalConverter):
     """Models an axle differential."""
     def __init__(self,
@@ -108,8 +108,8 @@ class Differential(MechanicalConverter):
                  inertia: float):
         snap = return_gearbox_snapshot()
         consumption = GearBoxConsumption(
-            out_to_in_efficiency_func=lambda s: efficiency,
-            in_to_out_efficiency_func=lambda s: efficiency
+            out_to_in_efficiency_func=efficiency,
+            in_to_out_efficiency_func=efficiency
         )
         dynamic_response = PureMechanicalDynamicResponse(
             forward_response=MechanicalToMechanical.forward_gearbox(
@@ -133,7 +133,7 @@ class Differential(MechanicalConverter):
         self.gear_ratio = gear_ratio
 
 
-@dataclass
+@dataclass(eq=False)
 class GearBox(MechanicalConverter):
     """Models a gear box."""
     def __init__(self,
@@ -145,8 +145,8 @@ class GearBox(MechanicalConverter):
                  inertia: float):
         snap = return_gearbox_snapshot()
         consumption = GearBoxConsumption(
-            out_to_in_efficiency_func=lambda s: efficiency,
-            in_to_out_efficiency_func=lambda s: efficiency
+            out_to_in_efficiency_func=efficiency,
+            in_to_out_efficiency_func=efficiency
         )
         dynamic_response = PureMechanicalDynamicResponse(
             forward_response=MechanicalToMechanical.forward_gearbox(
@@ -170,7 +170,7 @@ class GearBox(MechanicalConverter):
         self.gear_ratio = gear_ratio
 
 
-@dataclass
+@dataclass(eq=False)
 class PlanetaryGear(MechanicalConverter):
     """Models a planetary gear train."""
 #     def __init__(self,
@@ -45,12 +45,13 @@ class MechanicalToMechanical():
                               more_than=0.0,
                               less_than=1.0,
                               include_more=False)
+        inv_gear_ratio = 1.0 / gear_ratio
         def response(snap: GearBoxSnapshot) -> tuple[GearBoxSnapshot,
                                                      PureMechanicalState]:
             assert isinstance(snap, GearBoxSnapshot)
             torque_out = snap.io.input_port.torque * gear_ratio * efficiency
             rpm_in = snap.state.input_port.rpm
-            rpm_out = rpm_in / gear_ratio
+            rpm_out = rpm_in * inv_gear_ratio
             new_state = PureMechanicalState(input_port=RotatingState(rpm=rpm_in),
                                             internal=snap.state.internal,
                                             output_port=RotatingState(rpm=rpm_out))
@@ -76,10 +77,11 @@ class MechanicalToMechanical():
                               more_than=0.0,
                               less_than=1.0,
                               include_more=False)
+        efficiency_per_ratio = efficiency / gear_ratio
         def response(snap: GearBoxSnapshot) -> tuple[GearBoxSnapshot,
                                                      PureMechanicalState]:
             assert isinstance(snap, GearBoxSnapshot)
-            torque_in = snap.io.output_port.torque / gear_ratio * efficiency
+            torque_in = snap.io.output_port.torque * efficiency_per_ratio
             rpm_in = snap.state.output_port.rpm * gear_ratio
             new_state = PureMechanicalState(input_port=RotatingState(rpm=rpm_in),
                                             internal=snap.state.internal,
@@ -176,8 +178,9 @@ class ElectricToMechanical():
             assert_type_and_range(control_signal,
                                   more_than=0.0,
                                   less_than=1.0)
-            min_torque = limits.relative_limits.output.torque.min(snap)
-            max_torque = limits.relative_limits.output.torque.max(snap)
+            torque_limits = limits.relative_limits.output.torque
+            min_torque = torque_limits.min(snap)
+            max_torque = torque_limits.max(snap)
             torque = (max_torque - min_torque) * control_signal + min_torque
             w_dot = (torque - load_torque) / downstream_inertia
             efficiency_value = efficiency.in_to_out_efficiency_value(snap=snap)
@@ -293,8 +296,9 @@ class FuelToMechanical():
             assert_type_and_range(control_signal,
                                   more_than=0.0,
                                   less_than=1.0)
-            min_torque = limits.relative_limits.output.torque.min(snap)
-            max_torque = limits.relative_limits.output.torque.max(snap)
+            torque_limits = limits.relative_limits.output.torque
+            min_torque = torque_limits.min(snap)
+            max_torque = torque_limits.max(snap)
             torque = (max_torque - min_torque) * control_signal + min_torque
             w_dot = (torque - load_torque) / downstream_inertia
             new_rpm = snap.state.output_port.rpm + ang_vel_to_rpm(ang_vel=w_dot * delta_t)
@@ -339,8 +343,9 @@ class FuelToMechanical():
             assert_type_and_range(control_signal,
                                   more_than=0.0,
                                   less_than=1.0)
-            min_torque = limits.relative_limits.output.torque.min(snap)
-            max_torque = limits.relative_limits.output.torque.max(snap)
+            torque_limits = limits.relative_limits.output.torque
+            min_torque = torque_limits.min(snap)
+            max_torque = torque_limits.max(snap)
             torque = (max_torque - min_torque) * control_signal + min_torque
             w_dot = (torque - load_torque) / downstream_inertia
             new_rpm = snap.state.output_port.rpm + ang_vel_to_rpm(ang_vel=w_dot * delta_t)
@@ -385,9 +390,9 @@ class FuelToElectric():
                         expected_type=FuelCellConsumption)
             assert_type(limits,
                         expected_type=FuelCellLimits)
-            power_out = (limits.relative_limits.output.power.max(snap) - \
-                        limits.relative_limits.output.power.min(snap)) * control_signal + \
-                        limits.relative_limits.output.power.min(snap)
+            power_limits = limits.relative_limits.output.power
+            min_power = power_limits.min(snap)
+            power_out = (power_limits.max(snap) - min_power) * control_signal + min_power
             new_snap = FuelCellSnapshot(io=FuelCellIO(input_port=snap.io.input_port,
                                                       output_port=ElectricIO(electric_power=power_out)),
                                         state=snap.state)
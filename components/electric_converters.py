@@ -13,7 +13,7 @@ from helpers.functions import assert_type_and_range
 from helpers.types import PowerType
 
 
-@dataclass
+@dataclass(eq=False)
 class PureElectricConverter(Converter):
     """
     Base class for electric to electric converters.
@@ -30,7 +30,7 @@ class PureElectricConverter(Converter):
                               include_more=False)
 
 
-@dataclass
+@dataclass(eq=False)
 class Inverter(PureElectricConverter):
     """
     Models an electric inverter, which converts DC to AC.
@@ -57,7 +57,7 @@ class Inverter(PureElectricConverter):
                          nominal_voltage_out=nominal_voltage_out)
 
 
-@dataclass
+@dataclass(eq=False)
 class Rectifier(PureElectricConverter):
     """
     Models an electric rectifier, which converts AC to DC.
@@ -1,29 +1,57 @@
 """This module contains a base class for all power sources for the vehicle."""
 
 from abc import ABC
-from dataclasses import dataclass, field
-from typing import Optional, TypeVar, Generic
-from uuid import uuid4
+from dataclasses import dataclass
+from math import isclose
+from typing import Callable, ClassVar, Optional, TypeVar, Generic
+from itertools import count
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
 from components.consumption import RechargeableBatteryConsumption, \
     NonRechargeableBatteryConsumption
 from components.fuel_type import Fuel, LiquidFuel, GaseousFuel
 from components.port import Port, PortInput, PortOutput, PortBidirectional, PortType
+from components.energy_source_batch import energy_trajectory
 from components.component_snapshot import EnergySourceSnapshot, \
     RechargeableBatterySnapshot, NonRechargeableBatterySnapshot, \
     LiquidFuelTankSnapshot, GaseousFuelTankSnapshot, \
     return_rechargeable_battery_snapshot, return_non_rechargeable_battery_snapshot, \
     return_liquid_fuel_tank_snapshot, return_gaseous_fuel_tank_snapshot
-from helpers.functions import assert_type, assert_type_and_range, liters_to_cubic_meters, clamp
+from helpers.functions import assert_type, assert_type_and_range
 from helpers.types import PowerType, ElectricSignalType
-from simulation.constants import BATTERY_DEFAULT_SOH
+from simulation.constants import BATTERY_DEFAULT_SOH, LTS_TO_CUBIC_METERS
 
 battery_snap = TypeVar("battery_snap",
                         bound=RechargeableBatterySnapshot|NonRechargeableBatterySnapshot)
 battery_consumption = TypeVar("battery_consumption",
                               bound=RechargeableBatteryConsumption|NonRechargeableBatteryConsumption)
 
+_ID_COUNTER = count()
 
-@dataclass
+_ELECTRIC_DC_INPUT = PortInput(exchange=PowerType.ELECTRIC_DC)
+_ELECTRIC_DC_OUTPUT = PortOutput(exchange=PowerType.ELECTRIC_DC)
+
+_BATTERY_SNAPSHOT_FACTORIES: dict[bool, Callable[..., RechargeableBatterySnapshot|NonRechargeableBatterySnapshot]] = {
+    True: return_rechargeable_battery_snapshot,
+    False: return_non_rechargeable_battery_snapshot}
+
+
+def _validate_energy_source(source: "EnergySource") -> None:
+    """
+    Checks the base attributes of an energy source in a single frame,
+    avoiding the nested calls of the generic assertion helpers.
+    """
+    name, mass, snap = source.name, source.system_mass, source.snapshot
+    assert isinstance(name, str), \
+        f"Variable {name}: Expected {str}, got {type(name).__name__}"
+    assert isinstance(mass, (float, int)) and mass >= 0.0, \
+        f"Variable {mass}: Expected a non-negative number, got {type(mass).__name__}"
+    assert isinstance(snap, EnergySourceSnapshot), \
+        f"Variable {snap}: Expected {EnergySourceSnapshot}, got {type(snap).__name__}"
+    assert source.input is None or source.input.exchange==source.output.exchange
+
+
+@dataclass(eq=False)
 class EnergySource(ABC):
     """
     Base class for modules that only store and deliver energy.
@@ -41,35 +69,41 @@ class EnergySource(ABC):
         - `soh` (float): models the degradation of the source [0.0-1.0]
         - `efficiency` (float): efficiency when delivering or receiving [0.0-1.0]
         - `rechargeable` (bool): allows the source to be recharged
+        - `energy_medium` (Fuel or PowerType): the medium exchanged at the output
+        - `stores_fuel` (bool): whether the energy medium is a fuel
     """
+    __slots__ = ("name", "input", "output", "system_mass", "snapshot",
+                 "rechargeable", "energy_medium", "id", "_ports", "_internal")
+    stores_fuel: ClassVar[bool]
+    _state_slots: ClassVar[tuple[str, ...]] = __slots__
     name: str
     input: Optional[PortInput|PortBidirectional]
     output: PortOutput|PortBidirectional
     system_mass: float
     snapshot: EnergySourceSnapshot
 
-    def __post_init__(self):
-        assert_type(self.name,
-                    expected_type=str)
-        assert_type_and_range(self.system_mass,
-                              more_than=0.0)
-        assert_type(self.snapshot,
-                    expected_type=EnergySourceSnapshot)
-        if self.input is not None:
-            assert self.input.exchange==self.output.exchange
-            self.rechargeable = True
-        else:
-            self.rechargeable = False
-        if self.input is not None:
-            assert self.input.exchange==self.output.exchange
-        self.id = f"EnergySource-{uuid4()}"
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._state_slots = tuple(name
+                                 for klass in reversed(cls.__mro__)
+                                 for name in klass.__dict__.get("__slots__", ()))
 
-    @property
-    def energy_medium(self) -> Fuel|PowerType:
-        """
-        Returns the energy medium of the energy source.
-        """
-        return self.output.exchange
+    def __getstate__(self) -> dict:
+        return {name: getattr(self, name)
+                for name in self._state_slots if hasattr(self, name)}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __post_init__(self):
+        if __debug__:
+            _validate_energy_source(source=self)
+        self.rechargeable = self.input is not None
+        self.energy_medium: Fuel|PowerType = self.output.exchange
+        self._ports = {PortType.INPUT_PORT: self.input,
+                       PortType.OUTPUT_PORT: self.output}
+        self.id = f"EnergySource-{next(_ID_COUNTER)}"
 
     @property
     def max_energy(self) -> float:
@@ -111,11 +145,10 @@ class EnergySource(ABC):
         """
         Returns the requested Port object.
         """
-        assert_type(which,
-                    expected_type=PortType)
-        if which==PortType.INPUT_PORT:
-            return self.input
-        return self.output
+        if __debug__:
+            assert_type(which,
+                        expected_type=PortType)
+        return self._ports.get(which)
 
     def return_which_port(self, port: PortInput|PortOutput|PortBidirectional) -> Optional[PortType]:
         """
@@ -142,18 +175,24 @@ class EnergySource(ABC):
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(eq=False)
 class Battery(EnergySource, Generic[battery_consumption, battery_snap]):
     """
     Models a generic battery.
     """
+    __slots__ = ("nominal_energy", "nominal_voltage", "max_power",
+                 "efficiency", "soh", "max_energy", "signal_type", "total_mass",
+                 "_io", "_inv_max_energy")
+    stores_fuel = False
     nominal_energy: float
     nominal_voltage: float
     max_power: float
     efficiency: battery_consumption
-    soh: float=BATTERY_DEFAULT_SOH
-    signal_type: ElectricSignalType=field(init=False)
-    snapshot: battery_snap=field(init=False)  #type: ignore
+    soh: float
+    max_energy: float
+    signal_type: ElectricSignalType
+    total_mass: float  # type: ignore
+    snapshot: battery_snap  #type: ignore
 
     def __init__(self,
                  name: str,
@@ -165,67 +204,106 @@ class Battery(EnergySource, Generic[battery_consumption, battery_snap]):
                  nominal_voltage: float,
                  efficiency: battery_consumption, #RechargeableBatteryConsumption | NonRechargeableBatteryConsumption,
                  soh: float=BATTERY_DEFAULT_SOH):
-        snap: battery_snap
-        if rechargeable:
-            snap = return_rechargeable_battery_snapshot(electric_energy_stored=min(nominal_energy, energy))  # type: ignore
-        else:
-            snap = return_non_rechargeable_battery_snapshot(electric_energy_stored=min(nominal_energy, energy))  # type: ignore
+        snap: battery_snap = _BATTERY_SNAPSHOT_FACTORIES[rechargeable](
+            electric_energy_stored=min(nominal_energy * soh, energy))  # type: ignore
         super().__init__(name=name,
-                         input=PortInput(exchange=PowerType.ELECTRIC_DC) if rechargeable else None,
-                         output=PortOutput(exchange=PowerType.ELECTRIC_DC),
+                         input=_ELECTRIC_DC_INPUT if rechargeable else None,
+                         output=_ELECTRIC_DC_OUTPUT,
                          system_mass=battery_mass,
                          snapshot=snap)
-        assert_type_and_range(nominal_voltage, max_power,
-                              more_than=0.0)
-        assert_type_and_range(soh,
-                              more_than=0.0,
-                              less_than=1.0)
+        if __debug__:
+            assert_type_and_range(nominal_voltage, max_power,
+                                  more_than=0.0)
+            assert_type_and_range(soh,
+                                  more_than=0.0,
+                                  less_than=1.0)
         self.nominal_energy = nominal_energy
         self.nominal_voltage = nominal_voltage
         self.max_power = max_power
         self.efficiency = efficiency
         self.soh = soh
+        self.invalidate_cache()
         self.signal_type = ElectricSignalType.DC
+        self._io = snap.io
+        self._internal = snap.state.internal
 
     @property
     def soc(self) -> float:
         """
         Returns the source's current state of charge (SOC).
         """
-        assert isinstance(self.snapshot,
-                          (RechargeableBatterySnapshot, NonRechargeableBatterySnapshot))
-        return self.snapshot.state.internal.electric_energy_stored / self.nominal_energy / self.soh
+        return self._internal.electric_energy_stored * self._inv_max_energy
 
-    @property
-    def max_energy(self):
-        return self.nominal_energy * self.soh
+    def set_soh(self, soh: float) -> None:
+        """
+        Updates the state of health and the
+        maximum energy that depends on it.
+        """
+        if __debug__:
+            assert_type_and_range(soh,
+                                  more_than=0.0,
+                                  less_than=1.0)
+        self.soh = soh
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """
+        Updates the cached maximum energy and total mass
+        after changes in the nominal energy, the SOH or
+        the system mass. Must be called if `nominal_energy`,
+        `soh` or `system_mass` are modified directly
+        instead of via `set_soh`.
+        """
+        self.max_energy = self.nominal_energy * self.soh
+        self._inv_max_energy = 1.0 / self.max_energy
+        self.total_mass = self.system_mass
 
     @property
     def is_empty(self):
-        assert isinstance(self.snapshot,
-                          (RechargeableBatterySnapshot, NonRechargeableBatterySnapshot))
-        return self.snapshot.state.internal.electric_energy_stored<=0.0
+        return self._internal.electric_energy_stored<=0.0
 
     @property
     def is_full(self):
-        assert isinstance(self.snapshot,
-                          (RechargeableBatterySnapshot, NonRechargeableBatterySnapshot))
-        return self.snapshot.state.internal.electric_energy_stored==self.max_energy
-
-    @property
-    def total_mass(self):
-        return self.system_mass
+        stored = self._internal.electric_energy_stored
+        max_energy = self.max_energy
+        return stored >= max_energy or isclose(stored, max_energy)
 
     def update_charge(self, delta_t: float) -> None:
         raise NotImplementedError
 
+    def simulate_cycle(self, power_out: ArrayLike,
+                       delta_t: float|ArrayLike,
+                       power_in: Optional[ArrayLike]=None,
+                       dtype: DTypeLike=np.float32
+                       ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Simulates the stored energy over a whole power profile
+        without modifying the battery's snapshot.
+        `delta_t` may be a scalar or one time step per sample.
+        Returns the state of charge and energy trajectories,
+        stored with the requested `dtype`. Raises `ValueError`
+        if `power_in` is given for a non-rechargeable battery.
+        """
+        net_power = -np.asarray(power_out, dtype=np.float64)
+        if power_in is not None:
+            if not self.rechargeable:
+                raise ValueError("Non-rechargeable batteries cannot take input power.")
+            net_power = net_power + np.asarray(power_in, dtype=np.float64)
+        energy = energy_trajectory(initial_energy=self._internal.electric_energy_stored,
+                                   max_energy=self.max_energy,
+                                   net_power=net_power,
+                                   delta_t=delta_t,
+                                   dtype=np.float64)
+        return (energy * self._inv_max_energy).astype(dtype, copy=False), \
+            energy.astype(dtype, copy=False)
+
 
-@dataclass
 class BatteryRechargeable(Battery["RechargeableBatteryConsumption",
                                   "RechargeableBatterySnapshot"]):
     """
     Models a generic, rechargeable battery.
     """
+    __slots__ = ()
     efficiency: RechargeableBatteryConsumption  # type: ignore
 
     def __init__(self,
@@ -252,42 +330,50 @@ class BatteryRechargeable(Battery["RechargeableBatteryConsumption",
         """
         Sets the output according to a resource request.
         """
-        assert_type_and_range(amount,
-                              more_than=0.0)
-        assert_type(which_port,
-                    expected_type=PortType)
-        if which_port==PortType.INPUT_PORT:
-            deliverable = self.max_power - self.snapshot.io.input_port.electric_power
-            self.snapshot.io.input_port.electric_power += min(deliverable, amount)
-            return self.snapshot.io.input_port.electric_power
-        deliverable = self.max_power - self.snapshot.io.output_port.electric_power
-        self.snapshot.io.output_port.electric_power += min(deliverable, amount)
-        return self.snapshot.io.output_port.electric_power
+        if __debug__:
+            assert_type_and_range(amount,
+                                  more_than=0.0)
+            assert_type(which_port,
+                        expected_type=PortType)
+        port = self._io.input_port if which_port==PortType.INPUT_PORT else self._io.output_port
+        headroom = self.max_power - port.electric_power
+        port.electric_power += amount if amount < headroom else headroom
+        return port.electric_power
 
     def add_request(self, amount: float,
                     which_port: PortType) -> float:
         """
         Sets the request according to a resource delivery.
         """
-        assert_type_and_range(amount,
-                              more_than=0.0)
-        assert_type(which_port,
-                    expected_type=PortType)
-        if which_port==PortType.INPUT_PORT:
-            self.snapshot.io.input_port.electric_power += amount
-            return self.snapshot.io.input_port.electric_power
-        self.snapshot.io.output_port.electric_power += amount
-        return self.snapshot.io.output_port.electric_power
+        if __debug__:
+            assert_type_and_range(amount,
+                                  more_than=0.0)
+            assert_type(which_port,
+                        expected_type=PortType)
+        port = self._io.input_port if which_port==PortType.INPUT_PORT else self._io.output_port
+        port.electric_power += amount
+        return port.electric_power
 
     def update_charge(self, delta_t: float) -> None:
-        power_in = self.snapshot.power_in
-        power_out = self.snapshot.power_out
-        energy_in = power_in * delta_t
-        energy_out = power_out * delta_t
-        self.snapshot.state.internal.electric_energy_stored = clamp(
-            val=self.snapshot.state.internal.electric_energy_stored + energy_in - energy_out,
-            min_val=0.0,
-            max_val=self.max_energy)
+        io = self._io
+        self.change_soc(power=io.input_port.electric_power - io.output_port.electric_power,
+                        delta_t=delta_t)
+
+    def change_soc(self, power: float, delta_t: float) -> float:
+        """
+        Applies a signed net `power` (positive when recharging,
+        negative when discharging) for `delta_t` seconds and
+        returns the resulting state of charge.
+        """
+        internal = self._internal
+        max_energy = self.max_energy
+        energy = internal.electric_energy_stored + power * delta_t
+        if energy < 0.0:
+            energy = 0.0
+        elif energy > max_energy:
+            energy = max_energy
+        internal.electric_energy_stored = energy
+        return energy * self._inv_max_energy
 
     @property
     def reversible(self) -> bool:
@@ -297,12 +383,12 @@ class BatteryRechargeable(Battery["RechargeableBatteryConsumption",
         return True
 
 
-@dataclass
 class BatteryNonRechargeable(Battery["NonRechargeableBatteryConsumption",
                                      "NonRechargeableBatterySnapshot"]):
     """
     Models a generic, non rechargeable battery type.
     """
+    __slots__ = ()
     efficiency: NonRechargeableBatteryConsumption  # type: ignore
 
     def __init__(self,
@@ -329,11 +415,22 @@ class BatteryNonRechargeable(Battery["NonRechargeableBatteryConsumption",
         """
         Sets the output according to a resource request.
         """
-        assert_type_and_range(amount,
-                              more_than=0.0)
-        deliverable: float = self.max_power - self.snapshot.io.output_port.electric_power
-        self.snapshot.io.output_port.electric_power += min(deliverable, amount)
-        return self.snapshot.io.output_port.electric_power
+        if __debug__:
+            assert_type_and_range(amount,
+                                  more_than=0.0)
+        port = self._io.output_port
+        headroom = self.max_power - port.electric_power
+        port.electric_power += amount if amount < headroom else headroom
+        return port.electric_power
+
+    def update_charge(self, delta_t: float) -> None:
+        """
+        Drains the energy delivered at the output.
+        There is no input to account for.
+        """
+        internal = self._internal
+        energy = internal.electric_energy_stored - self._io.output_port.electric_power * delta_t
+        internal.electric_energy_stored = energy if energy > 0.0 else 0.0
 
     @property
     def reversible(self) -> bool:
@@ -343,11 +440,13 @@ class BatteryNonRechargeable(Battery["NonRechargeableBatteryConsumption",
         return False
 
 
-@dataclass
+@dataclass(eq=False)
 class FuelTank(EnergySource):
     """
     Base class for fuel tanks.
     """
+    __slots__ = ("fuel",)
+    stores_fuel = True
     fuel: Fuel
 
     def __init__(self,
@@ -360,6 +459,7 @@ class FuelTank(EnergySource):
                          output=PortOutput(exchange=fuel),
                          system_mass=tank_mass,
                          snapshot=snap)
+        self.fuel = fuel
 
     @property
     def filled_percentage(self) -> float:
@@ -403,11 +503,13 @@ class FuelTank(EnergySource):
         return False
 
 
-@dataclass
+@dataclass(eq=False)
 class LiquidFuelTank(FuelTank):
     """
     Models a liquid fuel tank.
     """
+    __slots__ = ("capacity_liters", "_liters_to_mass", "_liters_to_energy",
+                 "_inv_capacity")
     fuel: LiquidFuel # type: ignore
     capacity_liters: float
     snapshot: LiquidFuelTankSnapshot # type: ignore
@@ -418,13 +520,14 @@ class LiquidFuelTank(FuelTank):
                  capacity_liters: float,
                  liters: float,
                  tank_mass: float):
-        assert_type(fuel,
-                    expected_type=LiquidFuel)
-        assert_type_and_range(capacity_liters,
-                              more_than=0.0)
-        assert_type_and_range(liters,
-                              more_than=0.0,
-                              less_than=capacity_liters)
+        if __debug__:
+            assert_type(fuel,
+                        expected_type=LiquidFuel)
+            assert_type_and_range(capacity_liters,
+                                  more_than=0.0)
+            assert_type_and_range(liters,
+                                  more_than=0.0,
+                                  less_than=capacity_liters)
         snap = return_liquid_fuel_tank_snapshot(fuel=fuel,
                                                 liters_stored=liters)
         super().__init__(name=name,
@@ -432,35 +535,40 @@ class LiquidFuelTank(FuelTank):
                          tank_mass=tank_mass,
                          snap=snap)
         self.capacity_liters = capacity_liters
+        self._inv_capacity = 1.0 / capacity_liters
+        # Fuels are frozen, so these factors cannot go stale.
+        self._liters_to_mass = LTS_TO_CUBIC_METERS * fuel.mass_density
+        self._liters_to_energy = self._liters_to_mass * fuel.energy_density
+        self._internal = snap.state.internal
 
     @property
     def fuel_mass(self):
-        return liters_to_cubic_meters(self.snapshot.state.internal.liters_stored) * \
-            self.fuel.mass_density
+        return self._internal.liters_stored * self._liters_to_mass
 
     @property
     def is_empty(self) -> bool:
-        return self.snapshot.state.internal.liters_stored==0.0
+        return self._internal.liters_stored<=0.0
 
     @property
     def is_full(self) -> bool:
-        return self.snapshot.state.internal.liters_stored==self.capacity_liters
+        liters = self._internal.liters_stored
+        return liters >= self.capacity_liters or isclose(liters, self.capacity_liters)
 
     @property
     def max_energy(self) -> float:
-        return liters_to_cubic_meters(liters=self.snapshot.state.internal.liters_stored) * \
-            self.fuel.mass_density * self.fuel.energy_density
+        return self._internal.liters_stored * self._liters_to_energy
 
     @property
     def filled_percentage(self) -> float:
-        return self.snapshot.state.internal.liters_stored / self.capacity_liters
+        return self._internal.liters_stored * self._inv_capacity
 
 
-@dataclass
+@dataclass(eq=False)
 class GaseousFuelTank(FuelTank):
     """
     Models a gaseous fuel tank.
     """
+    __slots__ = ("capacity_mass", "_mass_to_energy", "_inv_capacity")
     fuel: GaseousFuel # type: ignore
     capacity_mass: float
     snapshot: GaseousFuelTankSnapshot # type: ignore
@@ -471,13 +579,14 @@ class GaseousFuelTank(FuelTank):
                  capacity_mass: float,
                  fuel_mass: float,
                  tank_mass: float):
-        assert_type(fuel,
-                    expected_type=GaseousFuel)
-        assert_type_and_range(capacity_mass,
-                              more_than=0.0)
-        assert_type_and_range(fuel_mass,
-                              more_than=0.0,
-                              less_than=capacity_mass)
+        if __debug__:
+            assert_type(fuel,
+                        expected_type=GaseousFuel)
+            assert_type_and_range(capacity_mass,
+                                  more_than=0.0)
+            assert_type_and_range(fuel_mass,
+                                  more_than=0.0,
+                                  less_than=capacity_mass)
         snap = return_gaseous_fuel_tank_snapshot(fuel=fuel,
                                                  mass_stored=fuel_mass)
         super().__init__(name=name,
@@ -485,24 +594,27 @@ class GaseousFuelTank(FuelTank):
                          tank_mass=tank_mass,
                          snap=snap)
         self.capacity_mass = capacity_mass
+        self._inv_capacity = 1.0 / capacity_mass
+        self._mass_to_energy = fuel.energy_density  # fuels are frozen
+        self._internal = snap.state.internal
 
     @property
     def fuel_mass(self):
-        return self.snapshot.state.internal.mass_stored
+        return self._internal.mass_stored
 
     @property
     def is_empty(self) -> bool:
-        return self.snapshot.state.internal.mass_stored==0.0
+        return self._internal.mass_stored<=0.0
 
     @property
     def is_full(self) -> bool:
-        return self.snapshot.state.internal.mass_stored==self.capacity_mass
+        mass = self._internal.mass_stored
+        return mass >= self.capacity_mass or isclose(mass, self.capacity_mass)
 
     @property
     def max_energy(self) -> float:
-        return liters_to_cubic_meters(liters=self.snapshot.state.internal.mass_stored) * \
-            self.fuel.energy_density
+        return self._internal.mass_stored * self._mass_to_energy
 
     @property
     def filled_percentage(self) -> float:
-        return self.snapshot.state.internal.mass_stored / self.capacity_mass
+        return self._internal.mass_stored * self._inv_capacity
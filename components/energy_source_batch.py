@@ -0,0 +1,280 @@
+"""This module contains array routines for simulating
+energy sources over whole power profiles at once."""
+
+from dataclasses import dataclass, field
+from typing import Sequence, TYPE_CHECKING
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+from helpers.functions import assert_type_and_range
+
+if TYPE_CHECKING:
+    from components.energy_source import Battery
+
+
+def energy_trajectory(initial_energy: float,
+                      max_energy: float,
+                      net_power: ArrayLike,
+                      delta_t: float|ArrayLike,
+                      dtype: DTypeLike=np.float32) -> np.ndarray:
+    """
+    Returns the stored energy after each time step when `net_power`
+    (input minus output, in Watts) is applied for `delta_t` seconds
+    per step, clamping the energy to [0, `max_energy`].
+    `delta_t` may be a scalar or one value per step.
+    The first element is `initial_energy`.
+    The integration runs in double precision and the result
+    is stored with the requested `dtype`.
+    """
+    assert_type_and_range(initial_energy, max_energy,
+                          more_than=0.0)
+    delta_t = np.asarray(delta_t, dtype=np.float64)
+    assert np.all(delta_t >= 0.0)
+    steps = np.asarray(net_power, dtype=np.float64) * delta_t
+    assert steps.ndim == 1
+    trajectory = np.empty(steps.size + 1, dtype=np.float64)
+    trajectory[0] = initial_energy
+    trajectory[1:] = steps
+    np.cumsum(trajectory, out=trajectory)
+    out_of_range = (trajectory < 0.0) | (trajectory > max_energy)
+    first = int(out_of_range.argmax())
+    if not out_of_range[first]:
+        return trajectory.astype(dtype, copy=False)
+    # The running sum is exact up to the first step that leaves
+    # [0, max_energy], so only the rest needs the serial clamp.
+    start = max(first, 1)
+    energy = float(trajectory[start - 1])
+    for k, step in enumerate(steps[start - 1:].tolist(), start=start):
+        energy += step
+        if energy < 0.0:
+            energy = 0.0
+        elif energy > max_energy:
+            energy = max_energy
+        trajectory[k] = energy
+    return trajectory.astype(dtype, copy=False)
+
+
+def batch_energy_trajectory(initial_energy: ArrayLike,
+                            max_energy: ArrayLike,
+                            net_power: ArrayLike,
+                            delta_t: float|ArrayLike,
+                            dtype: DTypeLike=np.float32) -> np.ndarray:
+    """
+    Returns the stored energy of a fleet of batteries after each time
+    step, with one column per battery and one row of `net_power`
+    (input minus output, in Watts) per step.
+    `delta_t` may be a scalar or one value per step.
+    The first row is `initial_energy`.
+    Matches calling `energy_trajectory` on every column, advancing
+    all batteries with one vectorized clamp per time step.
+    """
+    initial_energy = np.asarray(initial_energy, dtype=np.float64)
+    max_energy = np.asarray(max_energy, dtype=np.float64)
+    assert initial_energy.ndim == 1 and initial_energy.shape == max_energy.shape
+    assert np.all(initial_energy >= 0.0) and np.all(max_energy >= 0.0)
+    delta_t = np.asarray(delta_t, dtype=np.float64)
+    assert np.all(delta_t >= 0.0)
+    if delta_t.ndim == 1:
+        delta_t = delta_t[:, np.newaxis]
+    steps = np.asarray(net_power, dtype=np.float64) * delta_t
+    assert steps.ndim == 2 and steps.shape[1] == initial_energy.size
+    trajectory = np.empty((steps.shape[0] + 1, initial_energy.size), dtype=np.float64)
+    trajectory[0] = initial_energy
+    for k, step in enumerate(steps, start=1):
+        np.add(trajectory[k - 1], step, out=trajectory[k])
+        np.clip(trajectory[k], 0.0, max_energy, out=trajectory[k])
+    return trajectory.astype(dtype, copy=False)
+
+
+def pack_batteries(batteries: Sequence["Battery"]
+                   ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gathers the stored energy, maximum energy, input power and
+    output power of `batteries` into contiguous column arrays.
+    Non rechargeable batteries get a zero input power.
+    """
+    count = len(batteries)
+    energy = np.fromiter((battery.snapshot.state.internal.electric_energy_stored
+                          for battery in batteries), dtype=np.float64, count=count)
+    max_energy = np.fromiter((battery.max_energy for battery in batteries),
+                             dtype=np.float64, count=count)
+    power_in = np.fromiter((battery.snapshot.io.input_port.electric_power
+                            if battery.rechargeable else 0.0
+                            for battery in batteries), dtype=np.float64, count=count)
+    power_out = np.fromiter((battery.snapshot.io.output_port.electric_power
+                             for battery in batteries), dtype=np.float64, count=count)
+    return energy, max_energy, power_in, power_out
+
+
+def unpack_batteries(batteries: Sequence["Battery"],
+                     energy: np.ndarray) -> None:
+    """
+    Writes the stored energy column back into `batteries`.
+    """
+    assert len(batteries) == energy.size
+    for battery, stored in zip(batteries, energy.tolist()):
+        battery.snapshot.state.internal.electric_energy_stored = stored
+
+
+def batch_update_charge(energy: np.ndarray,
+                        max_energy: np.ndarray,
+                        power_in: np.ndarray,
+                        power_out: np.ndarray,
+                        delta_t: float) -> np.ndarray:
+    """
+    Advances the stored energy of a whole fleet of batteries by
+    `delta_t` seconds in place, clamping each one to [0, `max_energy`].
+    Matches calling `update_charge` on every battery.
+    """
+    energy += (power_in - power_out) * delta_t
+    return np.clip(energy, 0.0, max_energy, out=energy)
+
+
+@dataclass
+class BatteryPack():
+    """
+    Holds the energy accounting of several batteries as contiguous
+    arrays, so a whole pack advances with one vectorized update.
+    The `Battery` objects are only refreshed when `store` is called.
+
+    Attributes:
+        - `batteries` (sequence of Battery): the batteries in the pack
+        - `energy` (array): stored energy of each battery (Joules)
+        - `max_energy` (array): maximum energy of each battery (Joules)
+        - `power_in` (array): input power of each battery (W)
+        - `power_out` (array): output power of each battery (W)
+        - `temperature` (array): internal temperature of each battery (K)
+        - `mass` (array): total mass of each battery (kg)
+        - `index` (dict): row of each battery, keyed by its id
+    """
+    batteries: Sequence["Battery"]
+    energy: np.ndarray=field(init=False)
+    max_energy: np.ndarray=field(init=False)
+    power_in: np.ndarray=field(init=False)
+    power_out: np.ndarray=field(init=False)
+    temperature: np.ndarray=field(init=False)
+    mass: np.ndarray=field(init=False)
+    index: dict[str, int]=field(init=False)
+
+    def __post_init__(self):
+        assert len(self.batteries) > 0
+        self.index = {battery.id: row for row, battery in enumerate(self.batteries)}
+        assert len(self.index) == len(self.batteries)
+        self.load()
+
+    def load(self) -> None:
+        """
+        Reads the energy and port powers from the batteries.
+        """
+        self.energy, self.max_energy, self.power_in, self.power_out = \
+            pack_batteries(self.batteries)
+        self.temperature = np.fromiter((battery.snapshot.state.internal.temperature
+                                        for battery in self.batteries),
+                                       dtype=np.float64, count=len(self.batteries))
+        self.mass = np.fromiter((battery.total_mass for battery in self.batteries),
+                                dtype=np.float64, count=len(self.batteries))
+
+    def register(self, battery: "Battery") -> int:
+        """
+        Appends `battery` to the pack and returns its row.
+        The arrays of the batteries already in the pack are kept.
+        """
+        assert battery.id not in self.index
+        row = len(self.batteries)
+        self.batteries = [*self.batteries, battery]
+        self.index[battery.id] = row
+        columns = pack_batteries([battery])
+        self.energy, self.max_energy, self.power_in, self.power_out = \
+            (np.append(array, column)
+             for array, column in zip((self.energy, self.max_energy,
+                                       self.power_in, self.power_out), columns))
+        self.temperature = np.append(self.temperature,
+                                     battery.snapshot.state.internal.temperature)
+        self.mass = np.append(self.mass, battery.total_mass)
+        return row
+
+    def store(self) -> None:
+        """
+        Writes the stored energy back into the batteries.
+        """
+        unpack_batteries(self.batteries, self.energy)
+
+    def update_charge(self, delta_t: float) -> None:
+        """
+        Advances every battery in the pack by `delta_t` seconds.
+        """
+        batch_update_charge(self.energy, self.max_energy,
+                            self.power_in, self.power_out, delta_t)
+
+    def step(self, delta_t: float) -> np.ndarray:
+        """
+        Advances every battery in the pack by `delta_t` seconds
+        and returns the resulting state of charge of each one.
+        """
+        self.update_charge(delta_t)
+        return self.soc
+
+    def simulate_cycle(self, power_out: ArrayLike,
+                       delta_t: float|ArrayLike,
+                       power_in: ArrayLike|None=None,
+                       dtype: DTypeLike=np.float32
+                       ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Simulates the whole pack over a power profile with one row
+        per time step and one column per battery, without modifying
+        the pack's arrays.
+        Returns the state of charge and energy trajectories,
+        stored with the requested `dtype`.
+        """
+        net_power = -np.asarray(power_out, dtype=np.float64)
+        if power_in is not None:
+            net_power = net_power + np.asarray(power_in, dtype=np.float64)
+        energy = batch_energy_trajectory(initial_energy=self.energy,
+                                         max_energy=self.max_energy,
+                                         net_power=net_power,
+                                         delta_t=delta_t,
+                                         dtype=np.float64)
+        return (energy / self.max_energy).astype(dtype, copy=False), \
+            energy.astype(dtype, copy=False)
+
+    def energy_of(self, battery_id: str) -> float:
+        """
+        Returns the energy stored in the battery with id `battery_id`.
+        """
+        return float(self.energy[self.index[battery_id]])
+
+    @property
+    def total_energy(self) -> float:
+        """
+        Returns the energy stored in the whole pack.
+        """
+        return float(self.energy.sum())
+
+    @property
+    def total_mass(self) -> float:
+        """
+        Returns the mass of the whole pack.
+        """
+        return float(self.mass.sum())
+
+    @property
+    def soc(self) -> np.ndarray:
+        """
+        Returns the state of charge of each battery.
+        """
+        return self.energy / self.max_energy
+
+    @property
+    def empty_mask(self) -> np.ndarray:
+        """
+        Returns which batteries have no usable energy left.
+        """
+        return self.energy <= 0.0
+
+    @property
+    def full_mask(self) -> np.ndarray:
+        """
+        Returns which batteries are fully charged, with the
+        same relative tolerance as `Battery.is_full`.
+        """
+        return (self.energy >= self.max_energy) | \
+            np.isclose(self.energy, self.max_energy, rtol=1e-9, atol=0.0)
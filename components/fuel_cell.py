@@ -2,11 +2,13 @@
 This module contains definitions for different types of fuel cells.
 """
 
-from typing import Optional
+from functools import lru_cache
+from collections.abc import Callable
+from typing import ClassVar, Optional
 from dataclasses import dataclass
 from components.fuel_cell_curves import FuelCellEfficiencyCurves
-from components.fuel_type import GaseousFuel, HydrogenGas
-from components.component_snapshot import return_fuel_cell_snapshot
+from components.fuel_type import GaseousFuel, HYDROGEN_GAS
+from components.component_snapshot import FuelCellSnapshot, return_fuel_cell_snapshot
 from components.consumption import FuelCellConsumption
 from components.converter import Converter
 from components.dynamic_response import FuelCellDynamicResponse
@@ -16,47 +18,47 @@ from components.port import PortInput, PortOutput
 from helpers.functions import assert_type, assert_type_and_range
 from helpers.types import PowerType
 
-fuel_cell_params = {"PEMembraneFC": {"EffAtZeroPower": 0.075,
-                                     "MaxEfficiencyValue": 0.50,
-                                     "MaxEfficiencyPower": 0.50,
-                                     "EfficiencyAtMaxPower": 0.375,
-                                     "MassPerKW": 1.0,
-                                     "Fuel": HydrogenGas()},
-                    "SolidOxideFC": {"EffAtZeroPower": 0.125,
-                                     "MaxEfficiencyValue": 0.60,
-                                     "MaxEfficiencyPower": 0.40,
-                                     "EfficiencyAtMaxPower": 0.475,
-                                     "MassPerKW": 12.5,
-                                     "Fuel": HydrogenGas()},
-                    "PhAcidFC": {"EffAtZeroPower": 0.10,
-                                 "MaxEfficiencyValue": 0.40,
-                                 "MaxEfficiencyPower": 0.60,
-                                 "EfficiencyAtMaxPower": 0.325,
-                                 "MassPerKW": 6.5,
-                                 "Fuel": HydrogenGas()},
-                    "AlkalineFC": {"EffAtZeroPower": 0.125,
-                                   "MaxEfficiencyValue": 0.60,
-                                   "MaxEfficiencyPower": 0.50,
-                                   "EfficiencyAtMaxPower": 0.475,
-                                   "MassPerKW": 4.0,
-                                   "Fuel": HydrogenGas()},
-                    "MoltenCarbonateFC": {"EffAtZeroPower": 0.15,
-                                          "MaxEfficiencyValue": 0.50,
-                                          "MaxEfficiencyPower": 0.45,
-                                          "EfficiencyAtMaxPower": 0.425,
-                                          "MassPerKW": 10.0,
-                                          "Fuel": HydrogenGas()}, # Should be natural gas
-                    "DirectMethanolFC": {"EffAtZeroPower": 0.055,
-                                         "MaxEfficiencyValue": 0.25,
-                                         "MaxEfficiencyPower": 0.30,
-                                         "EfficiencyAtMaxPower": 0.175,
-                                         "MassPerKW": 3.0,
-                                         "Fuel": HydrogenGas()}} # Should be liquid methanol
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
+class FuelCellParams():
+    """
+    Defines the efficiency curve, specific
+    mass and fuel of a fuel cell preset.
+    """
+    eff_at_zero_power: float
+    max_efficiency_value: float
+    max_efficiency_power: float
+    efficiency_at_max_power: float
+    mass_per_kw: float
+    fuel: GaseousFuel
+
+
+fuel_cell_params: dict[str, FuelCellParams] = {
+    "PEMembraneFC": FuelCellParams(eff_at_zero_power=0.075, max_efficiency_value=0.50,
+                                   max_efficiency_power=0.50, efficiency_at_max_power=0.375,
+                                   mass_per_kw=1.0, fuel=HYDROGEN_GAS),
+    "SolidOxideFC": FuelCellParams(eff_at_zero_power=0.125, max_efficiency_value=0.60,
+                                   max_efficiency_power=0.40, efficiency_at_max_power=0.475,
+                                   mass_per_kw=12.5, fuel=HYDROGEN_GAS),
+    "PhAcidFC": FuelCellParams(eff_at_zero_power=0.10, max_efficiency_value=0.40,
+                               max_efficiency_power=0.60, efficiency_at_max_power=0.325,
+                               mass_per_kw=6.5, fuel=HYDROGEN_GAS),
+    "AlkalineFC": FuelCellParams(eff_at_zero_power=0.125, max_efficiency_value=0.60,
+                                 max_efficiency_power=0.50, efficiency_at_max_power=0.475,
+                                 mass_per_kw=4.0, fuel=HYDROGEN_GAS),
+    "MoltenCarbonateFC": FuelCellParams(eff_at_zero_power=0.15, max_efficiency_value=0.50,
+                                        max_efficiency_power=0.45, efficiency_at_max_power=0.425,
+                                        mass_per_kw=10.0, fuel=HYDROGEN_GAS), # Should be natural gas
+    "DirectMethanolFC": FuelCellParams(eff_at_zero_power=0.055, max_efficiency_value=0.25,
+                                       max_efficiency_power=0.30, efficiency_at_max_power=0.175,
+                                       mass_per_kw=3.0, fuel=HYDROGEN_GAS), # Should be liquid methanol
+}
+
+
+@dataclass(eq=False)
 class FuelCell(Converter):
     """Models a generic Fuel Cell."""
+    __slots__ = ("nominal_voltage", "max_power")
     nominal_voltage: float
     max_power: float
 
@@ -69,22 +71,23 @@ class FuelCell(Converter):
                  max_power: float,
                  fuel: GaseousFuel,
                  dynamic_response: Optional[FuelCellDynamicResponse]=None):
-        assert_type_and_range(mass, nominal_voltage, max_power,
-                              more_than=0.0,
-                              include_more=False)
-        assert_type(limits,
-                    expected_type=FuelCellLimits)
-        assert_type(consumption,
-                    expected_type=FuelCellConsumption)
+        if __debug__:
+            assert_type_and_range(mass, nominal_voltage, max_power,
+                                  more_than=0.0,
+                                  include_more=False)
+            assert_type(limits,
+                        expected_type=FuelCellLimits)
+            assert_type(consumption,
+                        expected_type=FuelCellConsumption)
+            if dynamic_response is not None:
+                assert_type(dynamic_response,
+                            expected_type=FuelCellDynamicResponse)
+            assert_type(fuel,
+                        expected_type=GaseousFuel)
         if dynamic_response is None:
             dynamic_response = FuelCellDynamicResponse(
                 forward_response=FuelToElectric.gaseous_fuel_to_electric()
             )
-        else:
-            assert_type(dynamic_response,
-                        expected_type=FuelCellDynamicResponse)
-        assert_type(fuel,
-                    expected_type=GaseousFuel)
         snap = return_fuel_cell_snapshot(fuel_in=fuel)
         super().__init__(name=name,
                          mass=mass,
@@ -97,21 +100,50 @@ class FuelCell(Converter):
         self.nominal_voltage = nominal_voltage
         self.max_power = max_power
 
+    @staticmethod
+    def from_preset(preset: str,
+                    name: str,
+                    nominal_voltage: float,
+                    limits: FuelCellLimits,
+                    max_power: float,
+                    dynamic_response: Optional[FuelCellDynamicResponse]=None
+                    ) -> "PresetFuelCell":
+        """
+        Creates a fuel cell of the type named by `preset`,
+        which must be a key of `fuel_cell_params`.
+        """
+        assert preset in FUEL_CELL_PRESETS
+        return FUEL_CELL_PRESETS[preset](name=name,
+                                         nominal_voltage=nominal_voltage,
+                                         limits=limits,
+                                         max_power=max_power,
+                                         dynamic_response=dynamic_response)
+
+
+class PresetFuelCell(FuelCell):
+    """
+    Base class for fuel cells whose mass, consumption
+    and fuel come from an entry of `fuel_cell_params`.
+    """
+    __slots__ = ()
+    preset: ClassVar[str]
+    params: ClassVar[FuelCellParams]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.params = fuel_cell_params[cls.preset]
 
-@dataclass
-class PEMembraneFC(FuelCell):
-    """Models a Polymer Electrolyte Membrane Fuel Cell."""
     def __init__(self,
                  name: str,
                  nominal_voltage: float,
                  limits: FuelCellLimits,
                  max_power: float,
                  dynamic_response: Optional[FuelCellDynamicResponse]=None):
-        assert_type_and_range(nominal_voltage, max_power,
-                              more_than=0.0,
-                              include_more=False)
-        values = fuel_cell_params["PEMembraneFC"]
-        mass, consumption, fuel = return_fuel_cell_params(values=values,
+        if __debug__:
+            assert_type_and_range(nominal_voltage, max_power,
+                                  more_than=0.0,
+                                  include_more=False)
+        mass, consumption, fuel = return_fuel_cell_params(values=self.params,
                                                           max_power=max_power)
         super().__init__(name=name,
                          mass=mass,
@@ -123,149 +155,77 @@ class PEMembraneFC(FuelCell):
                          fuel=fuel)
 
 
-@dataclass
-class DirectMethanolFC(FuelCell):
+class PEMembraneFC(PresetFuelCell):
+    """Models a Polymer Electrolyte Membrane Fuel Cell."""
+    __slots__ = ()
+    preset = "PEMembraneFC"
+
+
+class DirectMethanolFC(PresetFuelCell):
     """Models a Direct Methanol Fuel Cell."""
-    def __init__(self,
-                 name: str,
-                 nominal_voltage: float,
-                 limits: FuelCellLimits,
-                 max_power: float,
-                 dynamic_response: Optional[FuelCellDynamicResponse]=None):
-        assert_type_and_range(nominal_voltage, max_power,
-                              more_than=0.0,
-                              include_more=False)
-        values = fuel_cell_params["DirectMethanolFC"]
-        mass, consumption, fuel = return_fuel_cell_params(values=values,
-                                                          max_power=max_power)
-        super().__init__(name=name,
-                         mass=mass,
-                         nominal_voltage=nominal_voltage,
-                         limits=limits,
-                         consumption=consumption,
-                         dynamic_response=dynamic_response,
-                         max_power=max_power,
-                         fuel=fuel)
+    __slots__ = ()
+    preset = "DirectMethanolFC"
 
 
-@dataclass
-class AlkalineFC(FuelCell):
+class AlkalineFC(PresetFuelCell):
     """Models an Alkaline Fuel Cell"""
-    def __init__(self,
-                 name: str,
-                 nominal_voltage: float,
-                 limits: FuelCellLimits,
-                 max_power: float,
-                 dynamic_response: Optional[FuelCellDynamicResponse]=None):
-        assert_type_and_range(nominal_voltage, max_power,
-                              more_than=0.0,
-                              include_more=False)
-        values = fuel_cell_params["AlkalineFC"]
-        mass, consumption, fuel = return_fuel_cell_params(values=values,
-                                                          max_power=max_power)
-        super().__init__(name=name,
-                         mass=mass,
-                         nominal_voltage=nominal_voltage,
-                         limits=limits,
-                         consumption=consumption,
-                         dynamic_response=dynamic_response,
-                         max_power=max_power,
-                         fuel=fuel)
+    __slots__ = ()
+    preset = "AlkalineFC"
 
 
-@dataclass
-class PhAcidFC(FuelCell):
+class PhAcidFC(PresetFuelCell):
     """Models a Phosphoric Acid Fuel Cell."""
-    def __init__(self,
-                 name: str,
-                 nominal_voltage: float,
-                 limits: FuelCellLimits,
-                 max_power: float,
-                 dynamic_response: Optional[FuelCellDynamicResponse]=None):
-        assert_type_and_range(nominal_voltage, max_power,
-                              more_than=0.0,
-                              include_more=False)
-        values = fuel_cell_params["PhAcidFC"]
-        mass, consumption, fuel = return_fuel_cell_params(values=values,
-                                                          max_power=max_power)
-        super().__init__(name=name,
-                         mass=mass,
-                         nominal_voltage=nominal_voltage,
-                         limits=limits,
-                         consumption=consumption,
-                         dynamic_response=dynamic_response,
-                         max_power=max_power,
-                         fuel=fuel)
+    __slots__ = ()
+    preset = "PhAcidFC"
 
 
-@dataclass
-class MoltenCarbonateFC(FuelCell):
+class MoltenCarbonateFC(PresetFuelCell):
     """Models a Molten Carbonate Fuel Cell."""
-    def __init__(self,
-                 name: str,
-                 nominal_voltage: float,
-                 limits: FuelCellLimits,
-                 max_power: float,
-                 dynamic_response: Optional[FuelCellDynamicResponse]=None):
-        assert_type_and_range(nominal_voltage, max_power,
-                              more_than=0.0,
-                              include_more=False)
-        values = fuel_cell_params["MoltenCarbonateFC"]
-        mass, consumption, fuel = return_fuel_cell_params(values=values,
-                                                          max_power=max_power)
-        super().__init__(name=name,
-                         mass=mass,
-                         nominal_voltage=nominal_voltage,
-                         limits=limits,
-                         consumption=consumption,
-                         dynamic_response=dynamic_response,
-                         max_power=max_power,
-                         fuel=fuel)
+    __slots__ = ()
+    preset = "MoltenCarbonateFC"
 
 
-@dataclass
-class SolidOxideFC(FuelCell):
+class SolidOxideFC(PresetFuelCell):
     """Models a Solid Oxide Fuel Cell."""
-    def __init__(self,
-                 name: str,
-                 nominal_voltage: float,
-                 limits: FuelCellLimits,
-                 max_power: float,
-                 dynamic_response: Optional[FuelCellDynamicResponse]=None):
-        assert_type_and_range(nominal_voltage, max_power,
-                              more_than=0.0,
-                              include_more=False)
-        values = fuel_cell_params["SolidOxideFC"]
-        mass, consumption, fuel = return_fuel_cell_params(values=values,
-                                                          max_power=max_power)
-        super().__init__(name=name,
-                         mass=mass,
-                         nominal_voltage=nominal_voltage,
-                         limits=limits,
-                         consumption=consumption,
-                         dynamic_response=dynamic_response,
-                         max_power=max_power,
-                         fuel=fuel)
-
+    __slots__ = ()
+    preset = "SolidOxideFC"
+
+
+@lru_cache(maxsize=256)
+def _fuel_cell_efficiency_curve(values: FuelCellParams,
+                                max_power: float) -> Callable[[FuelCellSnapshot],
+                                                              float]:
+    """
+    Returns the gaussian efficiency curve of a fuel cell with
+    parameters `values` rated at `max_power`. Curves are cached,
+    as they are stateless closures that can be shared.
+    """
+    return FuelCellEfficiencyCurves.gaussian(
+        min_power=0.0, min_power_eff=values.eff_at_zero_power,
+        power_peak_eff=values.max_efficiency_power * max_power,
+        peak_eff=values.max_efficiency_value,
+        max_power=max_power, max_power_eff=values.efficiency_at_max_power
+    )
 
-def return_fuel_cell_params(values: dict,
+def return_fuel_cell_params(values: FuelCellParams,
                             max_power: float
                             ) -> tuple[float,
                                        FuelCellConsumption,
                                        GaseousFuel]:
-    power_peak_eff = values["MaxEfficiencyPower"] * max_power
-    peak_eff = values["MaxEfficiencyValue"]
+    """
+    Returns the mass, a new consumption and the fuel of a
+    fuel cell with parameters `values` rated at `max_power`.
+    """
     consumption = FuelCellConsumption(
-        in_to_out_fuel_consumption_func=FuelCellEfficiencyCurves.gaussian(
-            min_power=0.0, min_power_eff=values["EffAtZeroPower"],
-            power_peak_eff=power_peak_eff, peak_eff=peak_eff,
-            max_power=max_power, max_power_eff=values["EfficiencyAtMaxPower"]
-        )
+        in_to_out_fuel_consumption_func=_fuel_cell_efficiency_curve(values=values,
+                                                                    max_power=max_power)
     )
-    mass = max_power * values["MassPerKW"] / 1_000.0
-    fuel = values["Fuel"]
+    mass = max_power * values.mass_per_kw / 1_000.0
+    fuel = values.fuel
     return mass, consumption, fuel
 
 FUEL_CELL_TYPES = [PhAcidFC, AlkalineFC, PEMembraneFC,
                    SolidOxideFC, DirectMethanolFC,
                    MoltenCarbonateFC]
+FUEL_CELL_PRESETS: dict[str, type[PresetFuelCell]] = {fc_type.preset: fc_type
+                                                      for fc_type in FUEL_CELL_TYPES}
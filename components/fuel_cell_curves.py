@@ -2,10 +2,46 @@
 
 from math import exp
 from collections.abc import Callable
+import numpy as np
+from numpy.typing import ArrayLike
 from components.component_snapshot import FuelCellSnapshot
 from components.state import FuelCellState
 from helpers.functions import assert_type_and_range, assert_range
 
+_INV_GAUSSIAN_FALLOFF = 1.0 / (exp(-0.5) - 1.0)
+
+
+def _gaussian_coefficients(min_power: float,
+                           min_power_eff: float,
+                           power_peak_eff: float,
+                           peak_eff: float,
+                           max_power: float,
+                           max_power_eff: float
+                           ) -> tuple[float, float, float, float, float, float]:
+    """
+    Validates the gaussian curve parameters and returns the
+    coefficients (k1, k2, neg_alpha1) below the peak and
+    (k3, k4, neg_alpha2) above it. The exponents are
+    returned negated so curves skip a negation per call.
+    """
+    assert_type_and_range(min_power, min_power_eff,
+                          power_peak_eff, peak_eff,
+                          max_power, max_power_eff,
+                          more_than=0.0)
+    assert_range(power_peak_eff,
+                 more_than=min_power,
+                 less_than=max_power)
+    assert_range(max_power_eff,
+                 more_than=min_power_eff,
+                 less_than=peak_eff)
+    k2 = (min_power_eff - peak_eff) * _INV_GAUSSIAN_FALLOFF
+    k1 = peak_eff - k2
+    neg_alpha1 = -0.5 / (power_peak_eff - min_power)**2
+    k4 = (max_power_eff - peak_eff) * _INV_GAUSSIAN_FALLOFF
+    k3 = peak_eff - k4
+    neg_alpha2 = -0.5 / (power_peak_eff - max_power)**2
+    return k1, k2, neg_alpha1, k3, k4, neg_alpha2
+
 
 class FuelCellEfficiencyCurves():
     """
@@ -41,26 +77,42 @@ class FuelCellEfficiencyCurves():
         """
         Returns a piecewise gaussian curve efficiency function.
         """
-        assert_type_and_range(min_power, min_power_eff,
-                              power_peak_eff, peak_eff,
-                              max_power, max_power_eff,
-                              more_than=0.0)
-        assert_range(power_peak_eff,
-                     more_than=min_power,
-                     less_than=max_power)
-        assert_range(max_power_eff,
-                     more_than=min_power_eff,
-                     less_than=peak_eff)
-        k2 = (min_power_eff - peak_eff) / (exp(-0.5)-1)
-        k1 = peak_eff - k2
-        alpha1 = 0.5 / (power_peak_eff - min_power)**2
-        k4 = (max_power_eff - peak_eff) / (exp(-0.5)-1)
-        k3 = peak_eff - k4
-        alpha2 = 0.5 / (power_peak_eff - max_power)**2
+        k1, k2, neg_alpha1, k3, k4, neg_alpha2 = _gaussian_coefficients(
+            min_power=min_power, min_power_eff=min_power_eff,
+            power_peak_eff=power_peak_eff, peak_eff=peak_eff,
+            max_power=max_power, max_power_eff=max_power_eff)
         def efficiency_func(snap: FuelCellSnapshot) -> float:
-            if not min_power <= snap.power_out <= max_power:
+            power = snap.power_out
+            if not min_power <= power <= max_power:
                 return 0.0
-            if snap.power_out <= power_peak_eff:
-                return k1 + k2 * exp(-alpha1*(snap.power_out - power_peak_eff)**2)
-            return k3 + k4 * exp(-alpha2*(snap.power_out - power_peak_eff)**2)
+            distance = power - power_peak_eff
+            if distance <= 0.0:
+                return k1 + k2 * exp(neg_alpha1 * distance * distance)
+            return k3 + k4 * exp(neg_alpha2 * distance * distance)
+        return efficiency_func
+
+    @staticmethod
+    def gaussian_batch(min_power: float,
+                       min_power_eff: float,
+                       power_peak_eff: float,
+                       peak_eff: float,
+                       max_power: float,
+                       max_power_eff: float) -> Callable[[ArrayLike], np.ndarray]:
+        """
+        Returns the same curve as `gaussian`, evaluated
+        on a whole array of output powers at once.
+        """
+        k1, k2, neg_alpha1, k3, k4, neg_alpha2 = _gaussian_coefficients(
+            min_power=min_power, min_power_eff=min_power_eff,
+            power_peak_eff=power_peak_eff, peak_eff=peak_eff,
+            max_power=max_power, max_power_eff=max_power_eff)
+        def efficiency_func(powers: ArrayLike) -> np.ndarray:
+            powers = np.asarray(powers, dtype=np.float64)
+            distance = powers - power_peak_eff
+            below_peak = distance <= 0.0
+            efficiency = np.where(below_peak,
+                                  k1 + k2 * np.exp(neg_alpha1 * distance * distance),
+                                  k3 + k4 * np.exp(neg_alpha2 * distance * distance))
+            in_range = (powers >= min_power) & (powers <= max_power)
+            return np.where(in_range, efficiency, 0.0)
         return efficiency_func
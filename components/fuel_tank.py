@@ -2,116 +2,82 @@
 This module contains definitions for fuel tanks for various fuels.
 """
 
-from dataclasses import dataclass
+from typing import ClassVar
 from components.energy_source import LiquidFuelTank, GaseousFuelTank
-from components.fuel_type import Biodiesel, Ethanol, Diesel, Gasoline, \
-    HydrogenGas, HydrogenLiquid, Methanol, Methane
+from components.fuel_type import BIODIESEL, ETHANOL, DIESEL, GASOLINE, \
+    HYDROGEN_GAS, HYDROGEN_LIQUID, METHANOL, METHANE, LiquidFuel, GaseousFuel
 
 # =================
 # LIQUID FUEL TANKS
 # =================
 
 
-@dataclass
-class GasolineTank(LiquidFuelTank):
+class PresetLiquidFuelTank(LiquidFuelTank):
     """
-    Models a gasoline (liquid) tank.
+    Base class for liquid fuel tanks
+    bound to a single, predefined fuel.
     """
+    __slots__ = ()
+    preset_fuel: ClassVar[LiquidFuel]
+
     def __init__(self,
                  name: str,
                  capacity_liters: float,
                  liters: float,
                  tank_mass: float):
         super().__init__(name=name,
-                         fuel=Gasoline(),
+                         fuel=self.preset_fuel,
                          capacity_liters=capacity_liters,
                          liters=liters,
                          tank_mass=tank_mass)
 
 
-@dataclass
-class DieselTank(LiquidFuelTank):
+class GasolineTank(PresetLiquidFuelTank):
+    """
+    Models a gasoline (liquid) tank.
+    """
+    __slots__ = ()
+    preset_fuel = GASOLINE
+
+
+class DieselTank(PresetLiquidFuelTank):
     """
     Models a diesel (liquid) tank.
     """
-    def __init__(self,
-                 name: str,
-                 capacity_liters: float,
-                 liters: float,
-                 tank_mass: float):
-        super().__init__(name=name,
-                         fuel=Diesel(),
-                         capacity_liters=capacity_liters,
-                         liters=liters,
-                         tank_mass=tank_mass)
+    __slots__ = ()
+    preset_fuel = DIESEL
 
 
-@dataclass
-class HydrogenLiquidTank(LiquidFuelTank):
+class HydrogenLiquidTank(PresetLiquidFuelTank):
     """
     Models a hydrogen (liquid) tank.
     """
-    def __init__(self,
-                 name: str,
-                 capacity_liters: float,
-                 liters: float,
-                 tank_mass: float):
-        super().__init__(name=name,
-                         fuel=HydrogenLiquid(),
-                         capacity_liters=capacity_liters,
-                         liters=liters,
-                         tank_mass=tank_mass)
+    __slots__ = ()
+    preset_fuel = HYDROGEN_LIQUID
 
 
-@dataclass
-class EthanolTank(LiquidFuelTank):
+class EthanolTank(PresetLiquidFuelTank):
     """
     Models an ethanol (liquid) tank.
     """
-    def __init__(self,
-                 name: str,
-                 capacity_liters: float,
-                 liters: float,
-                 tank_mass: float):
-        super().__init__(name=name,
-                         fuel=Ethanol(),
-                         capacity_liters=capacity_liters,
-                         liters=liters,
-                         tank_mass=tank_mass)
+    __slots__ = ()
+    preset_fuel = ETHANOL
 
 
-@dataclass
-class MethanolTank(LiquidFuelTank):
+class MethanolTank(PresetLiquidFuelTank):
     """
     Models a methanol (liquid) tank.
     """
-    def __init__(self,
-                 name: str,
-                 capacity_liters: float,
-                 liters: float,
-                 tank_mass: float):
-        super().__init__(name=name,
-                         fuel=Methanol(),
-                         capacity_liters=capacity_liters,
-                         liters=liters,
-                         tank_mass=tank_mass)
+    __slots__ = ()
+    preset_fuel = METHANOL
 
 
-@dataclass
-class BiodieselTank(LiquidFuelTank):
+class BiodieselTank(PresetLiquidFuelTank):
     """
     Models a biodiesel (liquid) tank.
     """
-    def __init__(self,
-                 name: str,
-                 capacity_liters: float,
-                 liters: float,
-                 tank_mass: float):
-        super().__init__(name=name,
-                         fuel=Biodiesel(),
-                         capacity_liters=capacity_liters,
-                         liters=liters,
-                         tank_mass=tank_mass)
+    __slots__ = ()
+    preset_fuel = BIODIESEL
 
 
 # ==================
@@ -119,38 +85,40 @@ class BiodieselTank(LiquidFuelTank):
 # ==================
 
 
-@dataclass
-class HydrogenGasTank(GaseousFuelTank):
+class PresetGaseousFuelTank(GaseousFuelTank):
     """
-    Models a hydrogen (gaseous) tank.
+    Base class for gaseous fuel tanks
+    bound to a single, predefined fuel.
     """
+    __slots__ = ()
+    preset_fuel: ClassVar[GaseousFuel]
+
     def __init__(self,
                  name: str,
                  capacity_mass: float,
                  fuel_mass: float,
                  tank_mass: float):
         super().__init__(name=name,
-                         fuel=HydrogenGas(),
+                         fuel=self.preset_fuel,
                          capacity_mass=capacity_mass,
                          fuel_mass=fuel_mass,
                          tank_mass=tank_mass)
 
 
-@dataclass
-class MethaneTank(GaseousFuelTank):
+class HydrogenGasTank(PresetGaseousFuelTank):
+    """
+    Models a hydrogen (gaseous) tank.
+    """
+    __slots__ = ()
+    preset_fuel = HYDROGEN_GAS
+
+
+class MethaneTank(PresetGaseousFuelTank):
     """
     Models a methane (gaseous) tank.
     """
-    def __init__(self,
-                 name: str,
-                 capacity_mass: float,
-                 fuel_mass: float,
-                 tank_mass: float):
-        super().__init__(name=name,
-                         fuel=Methane(),
-                         capacity_mass=capacity_mass,
-                         fuel_mass=fuel_mass,
-                         tank_mass=tank_mass)
+    __slots__ = ()
+    preset_fuel = METHANE
 
 LIQUID_FUEL_TANKS = [GasolineTank, DieselTank, HydrogenLiquidTank,
                      EthanolTank, MethanolTank, BiodieselTank]
@@ -3,17 +3,18 @@ This module contains definitions for different types of fuel.
 """
 
 from dataclasses import dataclass
-from helpers.functions import assert_type, assert_range, assert_type_and_range, \
-    liters_to_cubic_meters
+import numpy as np
+from numpy.typing import ArrayLike
+from helpers.functions import assert_type, assert_range, assert_type_and_range
 from helpers.types import PowerType, StateOfMatter
 from simulation.constants import ENERGY_DENSITY_BIODIESEL, ENERGY_DENSITY_DIESEL, \
     ENERGY_DENSITY_ETHANOL, ENERGY_DENSITY_GASOLINE, ENERGY_DENSITY_HYDROGEN, \
     ENERGY_DENSITY_METHANOL, ENERGY_DENSITY_METHANE, DENSITY_GASOLINE, \
     DENSITY_DIESEL, DENSITY_ETHANOL, DENSITY_METHANOL, DENSITY_BIODIESEL, \
-    DENSITY_HYDROGEN_LIQUID
+    DENSITY_HYDROGEN_LIQUID, LTS_TO_CUBIC_METERS
 
 
-@dataclass
+@dataclass(frozen=True)
 class Fuel():
     """
     Represents a type of fuel the vehicle can carry
@@ -24,49 +25,69 @@ class Fuel():
         - energy_density (float): the energy density in J/kg
         - density (float): the density of the fuel in kg/m³
         - state (StateOfMatter): whether the fuel is liquid, gaseous, or solid
+        - is_solid, is_liquid, is_gaseous (bool): flags derived from `state`
+
+    Fuels are immutable, so they hash by value and copies
+    of a fuel return the same (shared) instance.
     """
+    __slots__ = ("name", "energy_density", "state", "power_type",
+                 "is_solid", "is_liquid", "is_gaseous")
     name: str
     energy_density: float
     state: StateOfMatter
 
     def __post_init__(self):
-        assert_type(self.name,
-                    expected_type=str)
-        assert_type_and_range(self.energy_density,
-                              more_than=0.0,
-                              include_more=False)
-        assert_type(self.state,
-                    expected_type=StateOfMatter)
-        self.power_type = PowerType.CHEMICAL
-
-    @property
-    def is_solid(self) -> bool:
-        """Returns whether the fuel is solid."""
-        return self.state==StateOfMatter.SOLID
-
-    @property
-    def is_liquid(self) -> bool:
-        """Returns whether the fuel is liquid."""
-        return self.state==StateOfMatter.LIQUID
-
-    @property
-    def is_gaseous(self) -> bool:
-        """Returns whether the fuel is gaseous."""
-        return self.state==StateOfMatter.GASEOUS
+        if __debug__:
+            assert_type(self.name,
+                        expected_type=str)
+            assert_type_and_range(self.energy_density,
+                                  more_than=0.0,
+                                  include_more=False)
+            assert_type(self.state,
+                        expected_type=StateOfMatter)
+        object.__setattr__(self, "power_type", PowerType.CHEMICAL)
+        object.__setattr__(self, "is_solid", self.state is StateOfMatter.SOLID)
+        object.__setattr__(self, "is_liquid", self.state is StateOfMatter.LIQUID)
+        object.__setattr__(self, "is_gaseous", self.state is StateOfMatter.GASEOUS)
+
+    def __getstate__(self) -> dict:
+        return {name: getattr(self, name)
+                for klass in type(self).__mro__
+                for name in klass.__dict__.get("__slots__", ())}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def __copy__(self) -> "Fuel":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Fuel":
+        return self
 
     def energy_per_kg(self, mass: float) -> float:
         """
         Returns the amount of energy contained
         in a certain mass of fuel.
         """
-        assert_type_and_range(mass,
-                              more_than=0.0)
+        if __debug__:
+            assert_type_and_range(mass,
+                                  more_than=0.0)
         return mass * self.energy_density
 
+    def energy_per_kg_array(self, masses: ArrayLike) -> np.ndarray:
+        """
+        Returns the energy contained in each of several
+        masses of fuel, in a single vectorized operation.
+        """
+        return np.asarray(masses, dtype=np.float64) * self.energy_density
+
 
-@dataclass
+@dataclass(frozen=True)
 class GaseousFuel(Fuel):
     """Creates a gaseous fuel."""
+    __slots__ = ()
+
     def __init__(self,
                  name: str,
                  energy_density: float):
@@ -75,110 +96,150 @@ class GaseousFuel(Fuel):
                          state=StateOfMatter.GASEOUS)
 
 
-@dataclass
+@dataclass(frozen=True)
 class LiquidFuel(Fuel):
     """Creates a liquid fuel."""
+    __slots__ = ("mass_density", "_energy_per_cubic_meter", "_energy_per_liter")
     mass_density: float
 
     def __init__(self,
                  name: str,
                  energy_density: float,
                  mass_density: float):
-        assert_range(mass_density,
-                     more_than=0.0)
+        if __debug__:
+            assert_range(mass_density,
+                         more_than=0.0)
         super().__init__(name=name,
                          energy_density=energy_density,
                          state=StateOfMatter.LIQUID)
-        self.mass_density = mass_density
+        energy_per_cubic_meter = mass_density * energy_density
+        object.__setattr__(self, "mass_density", mass_density)
+        object.__setattr__(self, "_energy_per_cubic_meter", energy_per_cubic_meter)
+        object.__setattr__(self, "_energy_per_liter", LTS_TO_CUBIC_METERS * energy_per_cubic_meter)
 
     def energy_per_liter(self, liters: float) -> float:
         """
         Returns the amount of energy contained
         in a certain volume (liters) of fuel.
         """
-        assert_type_and_range(liters,
-                              more_than=0.0)
-        return self.energy_per_cubic_meter(cubic_meters=liters_to_cubic_meters(liters=liters))
+        if __debug__:
+            assert_type_and_range(liters,
+                                  more_than=0.0)
+        return liters * self._energy_per_liter
+
+    def energy_per_liter_array(self, liters: ArrayLike) -> np.ndarray:
+        """
+        Returns the energy contained in each of several
+        volumes (liters) of fuel, in a single vectorized operation.
+        """
+        return np.asarray(liters, dtype=np.float64) * self._energy_per_liter
 
     def energy_per_cubic_meter(self, cubic_meters: float) -> float:
         """
         Returns the amount of energy contained
         in a certain volume (liters) of fuel.
         """
-        assert_type_and_range(cubic_meters,
-                              more_than=0.0)
-        return cubic_meters * self.mass_density * self.energy_density
+        if __debug__:
+            assert_type_and_range(cubic_meters,
+                                  more_than=0.0)
+        return cubic_meters * self._energy_per_cubic_meter
 
 
-@dataclass
+@dataclass(frozen=True)
 class HydrogenGas(GaseousFuel):
     """Creates gaseous Hydrogen fuel."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Gaseous Hydrogen",
                          energy_density=ENERGY_DENSITY_HYDROGEN)
 
 
-@dataclass
+@dataclass(frozen=True)
 class HydrogenLiquid(LiquidFuel):
     """Creates liquid Hydrogen fuel."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Liquid Hydrogen",
                          energy_density=ENERGY_DENSITY_HYDROGEN,
                          mass_density=DENSITY_HYDROGEN_LIQUID)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Methane(GaseousFuel):
     """Creates gaseous Methane fuel."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Methane",
                          energy_density=ENERGY_DENSITY_METHANE)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Gasoline(LiquidFuel):
     """Creates liquid Gasoline fuel."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Gasoline",
                          energy_density=ENERGY_DENSITY_GASOLINE,
                          mass_density=DENSITY_GASOLINE)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Diesel(LiquidFuel):
     """Creates liquid Diesel fuel."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Diesel",
                          energy_density=ENERGY_DENSITY_DIESEL,
                          mass_density=DENSITY_DIESEL)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Ethanol(LiquidFuel):
     """Creates liquid Ethanol fuel."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Ethanol",
                          energy_density=ENERGY_DENSITY_ETHANOL,
                          mass_density=DENSITY_ETHANOL)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Methanol(LiquidFuel):
     """Creates liquid Methanol fuel."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Methanol",
                          energy_density=ENERGY_DENSITY_METHANOL,
                          mass_density=DENSITY_METHANOL)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Biodiesel(LiquidFuel):
     """Creates liquid Biodiesel fuel."""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(name="Biodiesel",
                          energy_density=ENERGY_DENSITY_BIODIESEL,
                          mass_density=DENSITY_BIODIESEL)
 
-LIQUID_FUELS: list[LiquidFuel] = [Biodiesel(), Diesel(), Ethanol(),
-                                  Gasoline(), HydrogenLiquid(), Methanol()]
-GASEOUS_FUELS: list[GaseousFuel] = [HydrogenGas(), Methane()]
+# Shared instances, so components using the same fuel reuse one object.
+BIODIESEL = Biodiesel()
+DIESEL = Diesel()
+ETHANOL = Ethanol()
+GASOLINE = Gasoline()
+HYDROGEN_LIQUID = HydrogenLiquid()
+METHANOL = Methanol()
+HYDROGEN_GAS = HydrogenGas()
+METHANE = Methane()
+
+LIQUID_FUELS: list[LiquidFuel] = [BIODIESEL, DIESEL, ETHANOL,
+                                  GASOLINE, HYDROGEN_LIQUID, METHANOL]
+GASEOUS_FUELS: list[GaseousFuel] = [HYDROGEN_GAS, METHANE]
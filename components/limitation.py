@@ -25,9 +25,10 @@ class AbsoluteLimitValue():
     min: float=0.0
 
     def __post_init__(self):
-        assert_range(self.max,
-                     more_than=self.min,
-                     include_more=False)
+        if __debug__:
+            assert_range(self.max,
+                         more_than=self.min,
+                         include_more=False)
 
 
 @dataclass
@@ -41,7 +42,8 @@ class RelativeLimitValue():
     min: Callable[[BaseSnapshot], float]=lambda s: 0.0
 
     def __post_init__(self):
-        assert_callable(self.max, self.min)
+        if __debug__:
+            assert_callable(self.max, self.min)
 
 
 # ====================
@@ -57,8 +59,9 @@ class AbsoluteInternalLimitations():
     temperature: AbsoluteLimitValue
 
     def __post_init__(self):
-        assert_type(self.temperature,
-                    expected_type=AbsoluteLimitValue)
+        if __debug__:
+            assert_type(self.temperature,
+                        expected_type=AbsoluteLimitValue)
 
 
 @dataclass
@@ -69,8 +72,9 @@ class RelativeInternalLimitations():
     temperature: RelativeLimitValue
 
     def __post_init__(self):
-        assert_type(self.temperature,
-                    expected_type=RelativeLimitValue)
+        if __debug__:
+            assert_type(self.temperature,
+                        expected_type=RelativeLimitValue)
 
 
 # ===============================================
@@ -86,8 +90,9 @@ class AbsoluteElectricLimitations():
     power: AbsoluteLimitValue
 
     def __post_init__(self):
-        assert_type(self.power,
-                    expected_type=AbsoluteLimitValue)
+        if __debug__:
+            assert_type(self.power,
+                        expected_type=AbsoluteLimitValue)
 
 
 @dataclass
@@ -98,8 +103,9 @@ class RelativeElectricLimitations():
     power: RelativeLimitValue
 
     def __post_init__(self):
-        assert_type(self.power,
-                    expected_type=RelativeLimitValue)
+        if __debug__:
+            assert_type(self.power,
+                        expected_type=RelativeLimitValue)
 
 
 @dataclass
@@ -111,8 +117,9 @@ class AbsoluteMechanicalLimitations():
     rpm: AbsoluteLimitValue
 
     def __post_init__(self):
-        assert_type(self.torque, self.rpm,
-                    expected_type=AbsoluteLimitValue)
+        if __debug__:
+            assert_type(self.torque, self.rpm,
+                        expected_type=AbsoluteLimitValue)
 
 
 @dataclass
@@ -124,8 +131,9 @@ class RelativeMechanicalLimitations():
     rpm: RelativeLimitValue
 
     def __post_init__(self):
-        assert_type(self.torque, self.rpm,
-                    expected_type=RelativeLimitValue)
+        if __debug__:
+            assert_type(self.torque, self.rpm,
+                        expected_type=RelativeLimitValue)
 
 
 @dataclass
@@ -136,8 +144,9 @@ class AbsoluteLiquidFuelLimitations():
     fuel_liters_transfer: AbsoluteLimitValue
 
     def __post_init__(self):
-        assert_type(self.fuel_liters_transfer,
-                    expected_type=AbsoluteLimitValue)
+        if __debug__:
+            assert_type(self.fuel_liters_transfer,
+                        expected_type=AbsoluteLimitValue)
 
 
 @dataclass
@@ -148,8 +157,9 @@ class RelativeLiquidFuelLimitations():
     fuel_liters_transfer: RelativeLimitValue
 
     def __post_init__(self):
-        assert_type(self.fuel_liters_transfer,
-                    expected_type=RelativeLimitValue)
+        if __debug__:
+            assert_type(self.fuel_liters_transfer,
+                        expected_type=RelativeLimitValue)
 
 
 @dataclass
@@ -160,8 +170,9 @@ class AbsoluteGaseousFuelLimitations():
     fuel_mass_transfer: AbsoluteLimitValue
 
     def __post_init__(self):
-        assert_type(self.fuel_mass_transfer,
-                    expected_type=AbsoluteLimitValue)
+        if __debug__:
+            assert_type(self.fuel_mass_transfer,
+                        expected_type=AbsoluteLimitValue)
 
 
 @dataclass
@@ -172,8 +183,9 @@ class RelativeGaseousFuelLimitations():
     fuel_mass_transfer: RelativeLimitValue
 
     def __post_init__(self):
-        assert_type(self.fuel_mass_transfer,
-                    expected_type=RelativeLimitValue)
+        if __debug__:
+            assert_type(self.fuel_mass_transfer,
+                        expected_type=RelativeLimitValue)
 
 
 # ===================
@@ -186,9 +198,10 @@ class AbsoluteElectricEnergyStorageLimitations():
     electric_energy_capacity: float
 
     def __post_init__(self):
-        assert_type_and_range(self.electric_energy_capacity,
-                              more_than=0.0,
-                              include_more=False)
+        if __debug__:
+            assert_type_and_range(self.electric_energy_capacity,
+                                  more_than=0.0,
+                                  include_more=False)
 
 
 @dataclass
@@ -196,7 +209,8 @@ class RelativeElectricEnergyStorageLimitations():
     electric_energy_capacity: Callable[[FullStateNoInput|FullStateWithInput], float]
 
     def __post_init__(self):
-        assert_callable(self.electric_energy_capacity)
+        if __debug__:
+            assert_callable(self.electric_energy_capacity)
 
 
 @dataclass
@@ -204,9 +218,10 @@ class AbsoluteLiquidFuelStorageLimitations():
     fuel_liters_capacity: float
 
     def __post_init__(self):
-        assert_type_and_range(self.fuel_liters_capacity,
-                              more_than=0.0,
-                              include_more=False)
+        if __debug__:
+            assert_type_and_range(self.fuel_liters_capacity,
+                                  more_than=0.0,
+                                  include_more=False)
 
 
 @dataclass
@@ -214,7 +229,8 @@ class RelativeLiquidFuelStorageLimitations():
     fuel_liters_capacity: Callable[[FullStateNoInput], float]
 
     def __post_init__(self):
-        assert_callable(self.fuel_liters_capacity)
+        if __debug__:
+            assert_callable(self.fuel_liters_capacity)
 
 
 @dataclass
@@ -222,9 +238,10 @@ class AbsoluteGaseousFuelStorageLimitations():
     fuel_mass_capacity: float
 
     def __post_init__(self):
-        assert_type_and_range(self.fuel_mass_capacity,
-                              more_than=0.0,
-                              include_more=False)
+        if __debug__:
+            assert_type_and_range(self.fuel_mass_capacity,
+                                  more_than=0.0,
+                                  include_more=False)
 
 
 @dataclass
@@ -232,7 +249,8 @@ class RelativeGaseousFuelStorageLimitations():
     fuel_mass_capacity: Callable[[FullStateNoInput], float]
 
     def __post_init__(self):
-        assert_callable(self.fuel_mass_capacity)
+        if __debug__:
+            assert_callable(self.fuel_mass_capacity)
 
 
 # ========================
@@ -245,16 +263,18 @@ class AbsoluteBaseLimitWithInternal():
     internal: AbsoluteInternalLimitations
 
     def __post_init__(self):
-        assert_type(self.internal,
-                    expected_type=AbsoluteInternalLimitations)
+        if __debug__:
+            assert_type(self.internal,
+                        expected_type=AbsoluteInternalLimitations)
 
 @dataclass
 class RelativeBaseLimitWithInternal():
     internal: RelativeInternalLimitations
 
     def __post_init__(self):
-        assert_type(self.internal,
-                    expected_type=RelativeInternalLimitations)
+        if __debug__:
+            assert_type(self.internal,
+                        expected_type=RelativeInternalLimitations)
 
 @dataclass
 class RechargeableBatteryAbsoluteLimits(AbsoluteBaseLimitWithInternal):
@@ -262,8 +282,9 @@ class RechargeableBatteryAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteElectricLimitations
 
     def __post_init__(self):
-        assert_type(self.input, self.output,
-                    expected_type=AbsoluteElectricLimitations)
+        if __debug__:
+            assert_type(self.input, self.output,
+                        expected_type=AbsoluteElectricLimitations)
 
 @dataclass
 class RechargeableBatteryRelativeLimits(RelativeBaseLimitWithInternal):
@@ -271,24 +292,27 @@ class RechargeableBatteryRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeElectricLimitations
 
     def __post_init__(self):
-        assert_type(self.input, self.output,
-                    expected_type=RelativeElectricLimitations)
+        if __debug__:
+            assert_type(self.input, self.output,
+                        expected_type=RelativeElectricLimitations)
 
 @dataclass
 class NonRechargeableBatteryAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteElectricLimitations
 
     def __post_init__(self):
-        assert_type(self.output,
-                    expected_type=AbsoluteElectricLimitations)
+        if __debug__:
+            assert_type(self.output,
+                        expected_type=AbsoluteElectricLimitations)
 
 @dataclass
 class NonRechargeableBatteryRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeElectricLimitations
 
     def __post_init__(self):
-        assert_type(self.output,
-                    expected_type=RelativeElectricLimitations)
+        if __debug__:
+            assert_type(self.output,
+                        expected_type=RelativeElectricLimitations)
 
 @dataclass
 class ElectricMotorAbsoluteLimits(AbsoluteBaseLimitWithInternal):
@@ -296,10 +320,11 @@ class ElectricMotorAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteMechanicalLimitations
 
     def __post_init__(self):
-        assert_type(self.input,
-                    expected_type=AbsoluteElectricLimitations)
-        assert_type(self.output,
-                    expected_type=AbsoluteMechanicalLimitations)
+        if __debug__:
+            assert_type(self.input,
+                        expected_type=AbsoluteElectricLimitations)
+            assert_type(self.output,
+                        expected_type=AbsoluteMechanicalLimitations)
 
 @dataclass
 class ElectricMotorRelativeLimits(RelativeBaseLimitWithInternal):
@@ -307,10 +332,11 @@ class ElectricMotorRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeMechanicalLimitations
 
     def __post_init__(self):
-        assert_type(self.input,
-                    expected_type=RelativeElectricLimitations)
-        assert_type(self.output,
-                    expected_type=RelativeMechanicalLimitations)
+        if __debug__:
+            assert_type(self.input,
+                        expected_type=RelativeElectricLimitations)
+            assert_type(self.output,
+                        expected_type=RelativeMechanicalLimitations)
 
 @dataclass
 class LiquidCombustionEngineAbsoluteLimits(AbsoluteBaseLimitWithInternal):
@@ -318,10 +344,11 @@ class LiquidCombustionEngineAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteMechanicalLimitations
 
     def __post_init__(self):
-        assert_type(self.input,
-                    expected_type=AbsoluteLiquidFuelLimitations)
-        assert_type(self.output,
-                    expected_type=AbsoluteMechanicalLimitations)
+        if __debug__:
+            assert_type(self.input,
+                        expected_type=AbsoluteLiquidFuelLimitations)
+            assert_type(self.output,
+                        expected_type=AbsoluteMechanicalLimitations)
 
 @dataclass
 class LiquidCombustionEngineRelativeLimits(RelativeBaseLimitWithInternal):
@@ -329,10 +356,11 @@ class LiquidCombustionEngineRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeMechanicalLimitations
 
     def __post_init__(self):
-        assert_type(self.input,
-                    expected_type=RelativeLiquidFuelLimitations)
-        assert_type(self.output,
-                    expected_type=RelativeMechanicalLimitations)
+        if __debug__:
+            assert_type(self.input,
+                        expected_type=RelativeLiquidFuelLimitations)
+            assert_type(self.output,
+                        expected_type=RelativeMechanicalLimitations)
 
 @dataclass
 class GaseousCombustionEngineAbsoluteLimits(AbsoluteBaseLimitWithInternal):
@@ -340,10 +368,11 @@ class GaseousCombustionEngineAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteMechanicalLimitations
 
     def __post_init__(self):
-        assert_type(self.input,
-                    expected_type=AbsoluteGaseousFuelLimitations)
-        assert_type(self.output,
-                    expected_type=AbsoluteMechanicalLimitations)
+        if __debug__:
+            assert_type(self.input,
+                        expected_type=AbsoluteGaseousFuelLimitations)
+            assert_type(self.output,
+                        expected_type=AbsoluteMechanicalLimitations)
 
 @dataclass
 class GaseousCombustionEngineRelativeLimits(RelativeBaseLimitWithInternal):
@@ -351,10 +380,11 @@ class GaseousCombustionEngineRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeMechanicalLimitations
 
     def __post_init__(self):
-        assert_type(self.input,
-                    expected_type=RelativeGaseousFuelLimitations)
-        assert_type(self.output,
-                    expected_type=RelativeMechanicalLimitations)
+        if __debug__:
+            assert_type(self.input,
+                        expected_type=RelativeGaseousFuelLimitations)
+            assert_type(self.output,
+                        expected_type=RelativeMechanicalLimitations)
 
 @dataclass
 class ElectricGeneratorAbsoluteLimits(AbsoluteBaseLimitWithInternal):
@@ -362,10 +392,11 @@ class ElectricGeneratorAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteElectricLimitations
 
     def __post_init__(self):
-        assert_type(self.input,
-                    expected_type=AbsoluteMechanicalLimitations)
-        assert_type(self.output,
-                    expected_type=AbsoluteElectricLimitations)
+        if __debug__:
+            assert_type(self.input,
+                        expected_type=AbsoluteMechanicalLimitations)
+            assert_type(self.output,
+                        expected_type=AbsoluteElectricLimitations)
 
 @dataclass
 class ElectricGeneratorRelativeLimits(RelativeBaseLimitWithInternal):
@@ -373,10 +404,11 @@ class ElectricGeneratorRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeElectricLimitations
 
     def __post_init__(self):
-        assert_type(self.input,
-                    expected_type=RelativeMechanicalLimitations)
-        assert_type(self.output,
-                    expected_type=RelativeElectricLimitations)
+        if __debug__:
+            assert_type(self.input,
+                        expected_type=RelativeMechanicalLimitations)
+            assert_type(self.output,
+                        expected_type=RelativeElectricLimitations)
 
 @dataclass
 class FuelCellAbsoluteLimits(AbsoluteBaseLimitWithInternal):
@@ -384,10 +416,11 @@ class FuelCellAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteElectricLimitations
 
     def __post_init__(self):
-        assert_type(self.input,
-                    expected_type=AbsoluteGaseousFuelLimitations)
-        assert_type(self.output,
-                    expected_type=AbsoluteElectricLimitations)
+        if __debug__:
+            assert_type(self.input,
+                        expected_type=AbsoluteGaseousFuelLimitations)
+            assert_type(self.output,
+                        expected_type=AbsoluteElectricLimitations)
 
 @dataclass
 class FuelCellRelativeLimits(RelativeBaseLimitWithInternal):
@@ -395,10 +428,11 @@ class FuelCellRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeElectricLimitations
 
     def __post_init__(self):
-        assert_type(self.input,
-                    expected_type=RelativeGaseousFuelLimitations)
-        assert_type(self.output,
-                    expected_type=RelativeElectricLimitations)
+        if __debug__:
+            assert_type(self.input,
+                        expected_type=RelativeGaseousFuelLimitations)
+            assert_type(self.output,
+                        expected_type=RelativeElectricLimitations)
 
 @dataclass
 class PureElectricAbsoluteLimits(AbsoluteBaseLimitWithInternal):
@@ -406,8 +440,9 @@ class PureElectricAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteElectricLimitations
 
     def __post_init__(self):
-        assert_type(self.input, self.output,
-                    expected_type=AbsoluteElectricLimitations)
+        if __debug__:
+            assert_type(self.input, self.output,
+                        expected_type=AbsoluteElectricLimitations)
 
 @dataclass
 class PureElectricRelativeLimits(RelativeBaseLimitWithInternal):
@@ -415,8 +450,9 @@ class PureElectricRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeElectricLimitations
 
     def __post_init__(self):
-        assert_type(self.input, self.output,
-                    expected_type=RelativeElectricLimitations)
+        if __debug__:
+            assert_type(self.input, self.output,
+                        expected_type=RelativeElectricLimitations)
 
 @dataclass
 class PureMechanicalAbsoluteLimits(AbsoluteBaseLimitWithInternal):
@@ -424,8 +460,9 @@ class PureMechanicalAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteMechanicalLimitations
 
     def __post_init__(self):
-        assert_type(self.input, self.output,
-                    expected_type=AbsoluteMechanicalLimitations)
+        if __debug__:
+            assert_type(self.input, self.output,
+                        expected_type=AbsoluteMechanicalLimitations)
 
 @dataclass
 class PureMechanicalRelativeLimits(RelativeBaseLimitWithInternal):
@@ -433,40 +470,45 @@ class PureMechanicalRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeMechanicalLimitations
 
     def __post_init__(self):
-        assert_type(self.input, self.output,
-                    expected_type=RelativeMechanicalLimitations)
+        if __debug__:
+            assert_type(self.input, self.output,
+                        expected_type=RelativeMechanicalLimitations)
 
 @dataclass
 class LiquidFuelTankAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteLiquidFuelLimitations
 
     def __post_init__(self):
-        assert_type(self.output,
-                    expected_type=AbsoluteLiquidFuelLimitations)
+        if __debug__:
+            assert_type(self.output,
+                        expected_type=AbsoluteLiquidFuelLimitations)
 
 @dataclass
 class LiquidFuelTankRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeLiquidFuelLimitations
 
     def __post_init__(self):
-        assert_type(self.output,
-                    expected_type=RelativeLiquidFuelLimitations)
+        if __debug__:
+            assert_type(self.output,
+                        expected_type=RelativeLiquidFuelLimitations)
 
 @dataclass
 class GaseousFuelTankAbsoluteLimits(AbsoluteBaseLimitWithInternal):
     output: AbsoluteGaseousFuelLimitations
 
     def __post_init__(self):
-        assert_type(self.output,
-                    expected_type=AbsoluteGaseousFuelLimitations)
+        if __debug__:
+            assert_type(self.output,
+                        expected_type=AbsoluteGaseousFuelLimitations)
 
 @dataclass
 class GaseousFuelTankRelativeLimits(RelativeBaseLimitWithInternal):
     output: RelativeGaseousFuelLimitations
 
     def __post_init__(self):
-        assert_type(self.output,
-                    expected_type=RelativeGaseousFuelLimitations)
+        if __debug__:
+            assert_type(self.output,
+                        expected_type=RelativeGaseousFuelLimitations)
 
 
 # ===========================
@@ -4,13 +4,15 @@ to exchange resources while simulating.
 """
 
 from dataclasses import dataclass, field
+from itertools import count
 from typing import Optional
-from uuid import uuid4
 from components.port import Port, PortInput, PortOutput, PortBidirectional
 from components.fuel_type import Fuel
 from helpers.functions import assert_type, assert_type_and_range
 from helpers.types import PowerType
 
+_ID_COUNTER = count()
+
 
 @dataclass
 class Message():
@@ -27,7 +29,7 @@ class Message():
                     expected_type=str)
         assert_type(self.from_port,
                     expected_type=Port)
-        self.message_id = f"Message-{uuid4()}"
+        self.message_id = f"Message-{next(_ID_COUNTER)}"
         self.resource = self.from_port.exchange
 
 
@@ -72,7 +74,8 @@ class RequestMessage(Message):
         Returns the amount of requested resource already delivered.
         """
         amount_delivered = sum(delivery.delivery for delivery in self.deliveries)
-        return min(amount_delivered, self.requested)
+        requested = self.requested
+        return amount_delivered if amount_delivered < requested else requested
 
     @property
     def remaining(self) -> float:
@@ -22,8 +22,14 @@ from components.port import PortInput, PortOutput, PortBidirectional, PortType
 from helpers.functions import assert_type, assert_type_and_range
 from helpers.types import PowerType, ElectricSignalType
 
+_SIGNAL_POWER_TYPES: dict[ElectricSignalType, PowerType] = {
+    ElectricSignalType.AC: PowerType.ELECTRIC_AC,
+    ElectricSignalType.DC: PowerType.ELECTRIC_DC}
+_POWER_SIGNAL_TYPES: dict[PowerType, ElectricSignalType] = {
+    power_type: signal_type for signal_type, power_type in _SIGNAL_POWER_TYPES.items()}
 
-@dataclass
+
+@dataclass(eq=False)
 class ElectricMotor(MechanicalConverter):
     """
     Models a reversible electric motor (can act as a generator).
@@ -57,9 +63,7 @@ class ElectricMotor(MechanicalConverter):
         snap = return_electric_motor_snapshot()
         super().__init__(name=name,
                          mass=mass,
-                         input=PortBidirectional(exchange=PowerType.ELECTRIC_AC
-                                                      if electric_type==ElectricSignalType.AC
-                                                      else PowerType.ELECTRIC_DC),
+                         input=PortBidirectional(exchange=_SIGNAL_POWER_TYPES[electric_type]),
                          output=PortBidirectional(exchange=PowerType.MECHANICAL),
                          snapshot=snap,
                          limits=limits,
@@ -73,9 +77,7 @@ class ElectricMotor(MechanicalConverter):
         """
         Returns the type of input electric signal.
         """
-        return (ElectricSignalType.AC
-                if self.input.exchange == PowerType.ELECTRIC_AC
-                else ElectricSignalType.DC)
+        return _POWER_SIGNAL_TYPES[self.input.exchange]
 
     def add_delivery(self, amount: float,
                      which_port: PortType) -> float:
@@ -89,7 +91,7 @@ class ElectricMotor(MechanicalConverter):
         return self.snapshot.io.output_port.torque
 
 
-@dataclass
+@dataclass(eq=False)
 class LiquidInternalCombustionEngine(MechanicalConverter):
     """
     Models an internal combustion engine
@@ -131,7 +133,7 @@ class LiquidInternalCombustionEngine(MechanicalConverter):
                          inertia=inertia)
 
 
-@dataclass
+@dataclass(eq=False)
 class GaseousInternalCombustionEngine(MechanicalConverter):
     """
     Models an internal combustion engine
@@ -173,7 +175,7 @@ class GaseousInternalCombustionEngine(MechanicalConverter):
                          inertia=inertia)
 
 
-@dataclass
+@dataclass(eq=False)
 class ElectricGenerator(MechanicalConverter):
     """
     Models an irreversible electric generator.
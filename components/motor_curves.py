@@ -6,7 +6,6 @@ from components.component_snapshot import ElectricMotorSnapshot, \
     LiquidCombustionEngineSnapshot, GaseousCombustionEngineSnapshot
 from helpers.functions import assert_type, assert_range, assert_type_and_range, \
     assert_numeric, assert_callable, power_to_torque
-from helpers.functions import clamp
 from helpers.types import MotorOperationPoint, MotorEfficiencyPoint
 
 ICESnapshot = LiquidCombustionEngineSnapshot | GaseousCombustionEngineSnapshot
@@ -43,10 +42,11 @@ class MechanicalMaxPowerVsRPMCurves():
                      more_than=0.0)
         assert_range(max_rpm.rpm,
                      more_than=min_rpm.rpm)
+        slope = (max_rpm.power - min_rpm.power) / (max_rpm.rpm - min_rpm.rpm)
         def power_func(snap: MotorSnapshot) -> float:
             if not min_rpm.rpm <= snap.state.output_port.rpm <= max_rpm.rpm:
                 return 0.0
-            return (max_rpm.power - min_rpm.power) * (snap.state.output_port.rpm - min_rpm.rpm) / (max_rpm.rpm - min_rpm.rpm) + min_rpm.power
+            return slope * (snap.state.output_port.rpm - min_rpm.rpm) + min_rpm.power
         return power_func
 
     @staticmethod
@@ -89,11 +89,12 @@ class MechanicalMaxPowerVsRPMCurves():
                               more_than=0.0)
         assert_type_and_range (max_rpm,
                                more_than=base_rpm)
+        power_per_rpm = max_power / base_rpm
         def power_func(snap: ElectricMotorSnapshot) -> float:
             if not 0.0 <= snap.state.output_port.rpm <= max_rpm:
                 return 0.0
             if snap.state.output_port.rpm <= base_rpm:
-                return max_power * snap.state.output_port.rpm / base_rpm
+                return power_per_rpm * snap.state.output_port.rpm
             return max_power
         return power_func
 
@@ -170,12 +171,15 @@ class MechanicalPowerEfficiencyCurves():
         def efficiency_func(snap: MotorSnapshot,
                             limit: bool=True) -> float:
             if limit:
-                snap.io.output_port.torque = clamp(val=snap.io.output_port.torque,
-                                                   min_val=0.0,
-                                                   max_val=max_torque_vs_rpm(snap))
-                snap.state.output_port.rpm = clamp(val=snap.state.output_port.rpm,
-                                                   min_val=min_rpm,
-                                                   max_val=max_rpm)
+                torque = snap.io.output_port.torque
+                max_torque = max_torque_vs_rpm(snap)
+                if torque > max_torque:
+                    torque = max_torque
+                snap.io.output_port.torque = torque if torque > 0.0 else 0.0
+                rpm = snap.state.output_port.rpm
+                if rpm > max_rpm:
+                    rpm = max_rpm
+                snap.state.output_port.rpm = rpm if rpm > min_rpm else min_rpm
             if not min_rpm <= snap.state.output_port.rpm <= max_rpm:
                 return 0.0
             if 0.0 <= snap.io.output_port.torque <= max_torque_vs_rpm(snap):
@@ -212,17 +216,18 @@ class MechanicalPowerEfficiencyCurves():
         assert_range(min_efficiency,
                      more_than=0.0,
                      less_than=max_efficiency)
+        inv_rpm_range = 1.0 / (max_rpm - min_rpm)
         def efficiency_func(snap: MotorSnapshot) -> float:
             if not min_rpm <= snap.state.output_port.rpm <= max_rpm:
                 return 0.0
-            if not 0.0 <= snap.power_out <= max_power_vs_rpm(snap):
-                return 0.0
             power_range = max_power_vs_rpm(snap)
-            rpm_range = max_rpm - min_rpm
-            power_distance = abs(snap.power_out - power_max_eff) / power_range
-            rpm_distance = abs(snap.state.output_port.rpm - rpm_max_eff) / rpm_range
+            if not 0.0 <= snap.power_out <= power_range:
+                return 0.0
+            power_distance = (snap.power_out - power_max_eff) / power_range
+            rpm_distance = (snap.state.output_port.rpm - rpm_max_eff) * inv_rpm_range
             elliptical_distance = sqrt((power_distance*power_falloff_rate)**2 + (rpm_distance*rpm_falloff_rate)**2)
-            return max(max_efficiency * max(0.0, 1.0 - elliptical_distance), min_efficiency)
+            efficiency = max_efficiency * (1.0 - elliptical_distance)
+            return efficiency if efficiency > min_efficiency else min_efficiency
         return efficiency_func
 
     @staticmethod
@@ -252,5 +257,6 @@ class MechanicalPowerEfficiencyCurves():
             if not min_rpm <= snap.state.output_port.rpm <= max_rpm or \
                not 0.0 <= snap.power_out <= max_power_vs_rpm(snap):
                 return 0.0
-            return max(max_eff.efficiency * exp(-falloff_rpm*(snap.state.output_port.rpm-max_eff.rpm)**2 - falloff_power*(snap.power_out-max_eff.power)**2), min_eff)
+            efficiency = max_eff.efficiency * exp(-falloff_rpm*(snap.state.output_port.rpm-max_eff.rpm)**2 - falloff_power*(snap.power_out-max_eff.power)**2)
+            return efficiency if efficiency > min_eff else min_eff
         return efficiency_func
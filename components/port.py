@@ -18,7 +18,7 @@ class PortType(Enum):
     OUTPUT_PORT = "OUTPUT_PORT"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Port():
     """
     Defines a port for a component to interface with other components.
@@ -40,7 +40,7 @@ class Port():
         return self.direction != other.direction
 
 
-@dataclass
+@dataclass(frozen=True)
 class PortInput(Port):
     """
     Defines an input port.
@@ -50,7 +50,7 @@ class PortInput(Port):
                          exchange=exchange)
 
 
-@dataclass
+@dataclass(frozen=True)
 class PortOutput(Port):
     """
     Defines an output port.
@@ -60,7 +60,7 @@ class PortOutput(Port):
                          exchange=exchange)
 
 
-@dataclass
+@dataclass(frozen=True)
 class PortBidirectional(Port):
     """
     Defines a bidirectional port.
@@ -2,8 +2,6 @@
 
 from collections import defaultdict
 import os
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
 import pandas as pd
 from simulation.simulator import Simulator
 
@@ -33,7 +31,6 @@ NICE_LABELS: dict[str, tuple[str, str, str]] = {
     "tractive_torque": ("Torque (%sN.m)", "Tractive torque", "Tractive torque (N.m)"),
     "position": ("Position (%sm)", "Position", "Position (m)"),
     "velocity": ("Velocity (%sm/s)", "Velocity", "Velocity (m/s)")}
-eng_formatter = ticker.EngFormatter()
 
 
 class ResultsManager():
@@ -81,7 +78,12 @@ class ResultsManager():
                  dpi: int=250):
         """
         Plots all DataFrames with subplots per variable.
+        Matplotlib is imported here so that running and
+        exporting a simulation does not pay for it.
         """
+        import matplotlib.pyplot as plt
+        import matplotlib.ticker as ticker
+        eng_formatter = ticker.EngFormatter()
         folder = f"{folder}/{self.simulation.name}"
         os.makedirs(folder, exist_ok=True)
         num_cols = max(num_cols, 1)
@@ -114,6 +114,8 @@ class Simulator():
         Simulates all time steps and stores state
         variables in the simulation history list.
         """
+        batteries = [source for source in self.vehicle.energy_sources
+                     if not source.stores_fuel]
         for n in range(self.time_steps):
             self.vehicle.request_stack.reset()
             #load_torque = self._track_load_torque()
@@ -121,8 +123,8 @@ class Simulator():
                 self._process_converter(converter=converter,
                                         load_torque=load_torque,
                                         n=n)
-            for energy_source in self.vehicle.energy_sources:
-                self._process_energy_source(energy_source=energy_source)
+            for battery in batteries:
+                self._process_battery(battery=battery)
             self._process_drive_train()
             self._process_vehicle(n=n,
                                   load_torque=load_torque)
@@ -236,14 +238,20 @@ class Simulator():
             self._propagate_output(component=converter)
             converter.snapshot.state = new_state
 
-    def _process_energy_source(self, energy_source: EnergySource) -> None:
-        if isinstance(energy_source, Battery):
-            assert isinstance(energy_source.snapshot, (RechargeableBatterySnapshot,
-                                                        NonRechargeableBatterySnapshot))
-            energy_source.update_charge(delta_t=self.delta_t)
-            new_source_snap = deepcopy(energy_source.snapshot)
-            self.history[energy_source.id]["snapshots"].append(new_source_snap)
-            energy_source.snapshot.io.output_port.electric_power = 0.0
+    def _process_battery(self, battery: Battery) -> None:
+        """
+        Updates the charge of a battery at the time step.
+        Fuel tanks have no per-step update and are
+        filtered out before the time loop.
+        """
+        if __debug__:
+            assert isinstance(battery, Battery)
+            assert isinstance(battery.snapshot, (RechargeableBatterySnapshot,
+                                                 NonRechargeableBatterySnapshot))
+        battery.update_charge(delta_t=self.delta_t)
+        new_source_snap = deepcopy(battery.snapshot)
+        self.history[battery.id]["snapshots"].append(new_source_snap)
+        battery.snapshot.io.output_port.electric_power = 0.0
 
     def _process_drive_train(self) -> None:
         new_dt_snap, new_dt_state = self.vehicle.drive_train.process_drive(snap=self.vehicle.drive_train.snapshot)
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from math import tan, cos, sin
 from typing import Optional
 from components.drive_train import Wheel
-from helpers.functions import degrees_to_radians, estimate_air_density, clamp
+from helpers.functions import degrees_to_radians, estimate_air_density
 from simulation.materials import TrackMaterial
 
 
@@ -360,9 +360,10 @@ class SlopeSection(TrackSection):
         self._slope_degrees = slope_degrees
 
     def altitude_value(self, d: float) -> float:
-        d = clamp(val=d,
-                  min_val=0.0,
-                  max_val=self.horizontal_length)
+        if d > self.horizontal_length:
+            d = self.horizontal_length
+        if d < 0.0:
+            d = 0.0
         return d * self.altitude_derivate(d=d) + self.base_altitude
 
     def altitude_derivate(self, d: float) -> float:
@@ -379,9 +380,11 @@ class SlopeSection(TrackSection):
                          distance: float) -> Optional[SectionResult]:
         angle = self.angle_degrees(d=d)
         if angle is not None:
-            distance_projected = abs(distance) * cos(degrees_to_radians(angle))
+            magnitude = distance if distance >= 0.0 else -distance
+            cos_angle = cos(degrees_to_radians(angle))
+            distance_projected = magnitude * cos_angle
             if distance >= 0.0:
-                d_max = (self.horizontal_length - d) / cos(degrees_to_radians(angle))
+                d_max = (self.horizontal_length - d) / cos_angle
                 if distance <= d_max:
                     return SectionResult(section=self,
                                          in_section_d=d+distance_projected,
@@ -390,12 +393,12 @@ class SlopeSection(TrackSection):
                                      in_section_d=-1.0,
                                      total_d=d,
                                      remainder=distance-d_max)
-            d_max = d / cos(degrees_to_radians(angle))
-            if abs(distance) <= d_max:
+            d_max = d / cos_angle
+            if magnitude <= d_max:
                 return SectionResult(section=self,
                                      in_section_d=d-distance_projected,
                                      total_d=d-distance_projected)
-            remaining_d = abs(distance) - d_max
+            remaining_d = magnitude - d_max
             return SectionResult(section=self,
                                  in_section_d=-2.0,
                                  total_d=d,
@@ -0,0 +1,59 @@
+"""This module contains test routines for the battery curves."""
+
+import numpy as np
+from components.battery_curves import BatteryEfficiencyCurves, BatteryVoltageVSCurrent
+
+max_power: float = 1_000.0
+max_current: float = 50.0
+
+
+def test_tabulated_efficiency() -> None:
+    def efficiency_func(power: float) -> float:
+        return 0.8 + 0.1 * power / max_power
+    tabulated = BatteryEfficiencyCurves.tabulated(efficiency_func=efficiency_func,
+                                                  max_power=max_power)
+    for power in (0.0, 1.0, 333.3, 500.0, 999.9, max_power):
+        assert abs(tabulated(power) - efficiency_func(power)) < 1e-12
+    assert tabulated(-1.0) == 0.0
+    assert tabulated(max_power + 1.0) == 0.0
+
+def test_tabulated_voltage() -> None:
+    constant = BatteryVoltageVSCurrent.constant_voltage(voltage=400.0,
+                                                        max_current=max_current)
+    tabulated = BatteryVoltageVSCurrent.tabulated(voltage_func=constant,
+                                                  max_current=max_current,
+                                                  points=11)
+    for current in (0.0, 12.5, 25.0, max_current):
+        assert tabulated(current) == 400.0
+    assert tabulated(max_current * 2) == 0.0
+
+def test_piecewise_linear_efficiency() -> None:
+    curve = BatteryEfficiencyCurves.piecewise_linear(powers=[0.0, 250.0, max_power],
+                                                     efficiencies=[0.7, 0.95, 0.85],
+                                                     points=9)
+    assert abs(curve(0.0) - 0.7) < 1e-12
+    assert abs(curve(125.0) - 0.825) < 1e-12
+    assert abs(curve(250.0) - 0.95) < 1e-12
+    assert abs(curve(max_power) - 0.85) < 1e-12
+    assert curve(max_power + 1.0) == 0.0
+
+def test_piecewise_linear_voltage() -> None:
+    curve = BatteryVoltageVSCurrent.piecewise_linear(currents=[10.0, max_current],
+                                                     voltages=[420.0, 380.0])
+    assert abs(curve(30.0) - 400.0) < 1e-9
+    assert curve(5.0) == 0.0
+
+def test_polynomial_voltage() -> None:
+    def voltage_func(current: float) -> float:
+        return 420.0 - 0.5 * current - 0.01 * current**2
+    curve = BatteryVoltageVSCurrent.polynomial(voltage_func=voltage_func,
+                                               max_current=max_current)
+    currents = np.linspace(0.0, max_current, 7)
+    assert np.allclose(curve(currents), [voltage_func(current) for current in currents])
+    assert abs(curve(12.5) - voltage_func(12.5)) < 1e-9
+
+def test_polynomial_efficiency() -> None:
+    curve = BatteryEfficiencyCurves.polynomial(efficiency_func=lambda power: 0.9,
+                                               max_power=max_power,
+                                               degree=0)
+    assert np.allclose(curve(np.array([0.0, 500.0, max_power])), 0.9)
@@ -268,3 +268,15 @@ def test_create_gearbox_consumption() -> None:
     result = torque_to_power(torque=torque_in,
                              rpm=rpm_in) * delta_t / eff2
     assert energy_consumption == result
+
+def test_constant_efficiency_consumption() -> None:
+    consumption = return_rechargeable_battery_consumption(discharge_efficiency_func=eff1,
+                                                          recharge_efficiency_func=eff2)
+    snap = return_rechargeable_battery_snapshot(electric_power_in=power_in,
+                                                electric_power_out=power_out,
+                                                electric_energy_stored=electric_energy_stored)
+    assert consumption.internal_to_out_efficiency_value(snap=snap) == eff1
+    assert consumption.compute_internal_to_out(snap=snap,
+                                               delta_t=delta_t) == power_out * delta_t / eff1
+    assert consumption.compute_in_to_internal(snap=snap,
+                                              delta_t=delta_t) == power_in * delta_t * eff2
@@ -8,7 +8,7 @@ from components.limitation import  \
 from components.motor import ElectricMotor, ElectricGenerator
 from tests.dynamic_response.test_dynamic_response import create_electric_motor_response, \
     create_electric_generator_response
-from helpers.types import ElectricSignalType
+from helpers.types import ElectricSignalType, PowerType
 
 
 class TestEMParams(TypedDict):
@@ -102,3 +102,15 @@ def test_create_electric_generator() -> None:
 def test_create_electric_motor() -> None:
     em = create_electric_motor()
     assert isinstance(em, ElectricMotor)
+    assert em.electric_type == ElectricSignalType.AC
+    assert em.input.exchange == PowerType.ELECTRIC_AC
+
+def test_electric_motor_identity_equality() -> None:
+    first, second = create_electric_motor(), create_electric_motor()
+    assert first == first and first != second
+    assert len({first, second}) == 2
+
+def test_converter_ids_are_unique() -> None:
+    ids = {create_electric_motor().id for _ in range(5)} | \
+        {create_electric_generator().id for _ in range(5)}
+    assert len(ids) == 10
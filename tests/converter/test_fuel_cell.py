@@ -1,6 +1,6 @@
 """This module contains test routines for the fuel cell class."""
 
-from components.fuel_cell import FUEL_CELL_TYPES
+from components.fuel_cell import FUEL_CELL_TYPES, FuelCell, PEMembraneFC
 from components.limitation import return_fuel_cell_limits
 
 nominal_voltage: float = 200.0
@@ -40,3 +40,47 @@ def test_create_fuel_cells() -> None:
                      limits=limits,
                      max_power=max_power)
         assert isinstance(fc, fc_type)
+
+def test_create_fuel_cell_from_preset() -> None:
+    fc = FuelCell.from_preset(preset="PEMembraneFC",
+                              name="Test fuel cell",
+                              nominal_voltage=nominal_voltage,
+                              limits=limits,
+                              max_power=max_power)
+    assert isinstance(fc, PEMembraneFC)
+    assert fc.mass == PEMembraneFC(name="Reference fuel cell",
+                                   nominal_voltage=nominal_voltage,
+                                   limits=limits,
+                                   max_power=max_power).mass
+
+def test_fuel_cell_curves_are_shared() -> None:
+    fc1 = PEMembraneFC(name="Fuel cell 1",
+                       nominal_voltage=nominal_voltage,
+                       limits=limits,
+                       max_power=max_power)
+    fc2 = PEMembraneFC(name="Fuel cell 2",
+                       nominal_voltage=nominal_voltage,
+                       limits=limits,
+                       max_power=max_power)
+    assert fc1.consumption is not fc2.consumption
+    assert fc1.consumption.in_to_out_fuel_consumption_func is \
+        fc2.consumption.in_to_out_fuel_consumption_func
+
+def test_fuel_cells_have_no_instance_dict() -> None:
+    for fc_type in FUEL_CELL_TYPES:
+        fc = fc_type(name="Test fuel cell",
+                     nominal_voltage=nominal_voltage,
+                     limits=limits,
+                     max_power=max_power)
+        assert not hasattr(fc, "__dict__")
+
+def test_preset_fuel_cell_rejects_non_positive_values() -> None:
+    for bad_voltage, bad_power in ((nominal_voltage, 0.0), (0.0, max_power)):
+        try:
+            PEMembraneFC(name="Test fuel cell",
+                         nominal_voltage=bad_voltage,
+                         limits=limits,
+                         max_power=bad_power)
+        except AssertionError:
+            continue
+        assert False, "non-positive values were accepted"
@@ -1,6 +1,7 @@
 """This module contains test routines for the Battery class."""
 
 from typing import TypedDict
+import numpy as np
 from components.battery import AlAirBattery, LiCoBattery, LiPoBattery, LiMnBattery, \
     LiPhBattery, NiCdBattery, NiMHBattery, PbAcidBattery, SolidStateBattery
 from components.consumption import RechargeableBatteryConsumption, \
@@ -129,3 +130,109 @@ def test_create_SolidStateBattery() -> SolidStateBattery:
     battery = create_battery_type(battery_type=SolidStateBattery)
     assert isinstance(battery, SolidStateBattery)
     return battery
+
+def test_battery_full_and_empty() -> None:
+    battery = create_rechargeable_battery()
+    assert not battery.is_full and not battery.is_empty
+    battery.snapshot.state.internal.electric_energy_stored = battery.max_energy * (1 - 1e-12)
+    assert battery.is_full
+    battery.snapshot.state.internal.electric_energy_stored = 0.0
+    assert battery.is_empty
+
+def test_non_rechargeable_battery_update_charge() -> None:
+    battery = create_non_rechargeable_battery()
+    battery.snapshot.io.output_port.electric_power = power
+    battery.update_charge(delta_t=1.0)
+    assert battery.snapshot.state.internal.electric_energy_stored == battery_dict["energy"] - power
+    battery.update_charge(delta_t=10.0)
+    assert battery.is_empty
+
+def test_battery_simulate_cycle() -> None:
+    battery = create_rechargeable_battery()
+    power_out = [power, 0.0, 2*power]
+    power_in = [0.0, power/2, 0.0]
+    soc, energy = battery.simulate_cycle(power_out=power_out,
+                                         delta_t=1.0,
+                                         power_in=power_in,
+                                         dtype=np.float64)
+    assert battery.snapshot.state.internal.electric_energy_stored == energy[0]
+    for k, (p_out, p_in) in enumerate(zip(power_out, power_in), start=1):
+        battery.snapshot.io.output_port.electric_power = p_out
+        battery.snapshot.io.input_port.electric_power = p_in
+        battery.update_charge(delta_t=1.0)
+        assert battery.snapshot.state.internal.electric_energy_stored == energy[k]
+        assert battery.soc == soc[k]
+    _, energy = battery.simulate_cycle(power_out=[-battery.max_energy], delta_t=2.0)
+    assert energy.dtype == np.float32
+    assert energy[-1] == np.float32(battery.max_energy)
+
+def test_non_rechargeable_battery_simulate_cycle_rejects_input() -> None:
+    battery = create_non_rechargeable_battery()
+    try:
+        battery.simulate_cycle(power_out=[power], delta_t=1.0, power_in=[power])
+    except ValueError:
+        return
+    assert False, "input power was accepted"
+
+def test_battery_slots() -> None:
+    for battery in (create_rechargeable_battery(), create_non_rechargeable_battery(),
+                    create_battery_type(battery_type=LiCoBattery)):
+        assert not hasattr(battery, "__dict__")
+        assert not hasattr(battery.snapshot.state.internal, "__dict__")
+        assert not hasattr(battery.snapshot.io.output_port, "__dict__")
+        assert battery.total_mass == battery.system_mass
+
+def test_battery_ids_are_unique() -> None:
+    ids = {create_rechargeable_battery().id for _ in range(10)}
+    assert len(ids) == 10
+    assert all(battery_id.startswith("EnergySource-") for battery_id in ids)
+
+def test_batteries_share_ports() -> None:
+    first, second = create_rechargeable_battery(), create_rechargeable_battery()
+    assert first.output is second.output and first.input is second.input
+
+def test_battery_simulate_cycle_variable_steps() -> None:
+    battery = create_rechargeable_battery()
+    steps = [0.5, 1.0, 2.0]
+    _, energy = battery.simulate_cycle(power_out=[power]*3,
+                                       delta_t=steps,
+                                       dtype=np.float64)
+    for k, delta_t in enumerate(steps, start=1):
+        battery.snapshot.io.output_port.electric_power = power
+        battery.update_charge(delta_t=delta_t)
+        assert battery.snapshot.state.internal.electric_energy_stored == energy[k]
+
+def test_battery_set_soh() -> None:
+    battery = create_rechargeable_battery()
+    battery.set_soh(soh=0.5)
+    assert battery.max_energy == battery.nominal_energy * 0.5
+    assert abs(battery.soc - battery.snapshot.state.internal.electric_energy_stored / battery.max_energy) < 1e-12
+
+def test_battery_change_soc() -> None:
+    battery = create_rechargeable_battery()
+    soc = battery.change_soc(power=-power, delta_t=1.0)
+    assert battery.snapshot.state.internal.electric_energy_stored == battery_dict["energy"] - power
+    assert soc == battery.soc
+    assert battery.change_soc(power=power, delta_t=100.0) == 1.0
+    assert battery.change_soc(power=-power, delta_t=100.0) == 0.0
+
+def test_battery_initial_energy_clamped_to_max_energy() -> None:
+    battery = LiCoBattery(name=battery_dict["name"],
+                          nominal_energy=battery_dict["nominal_energy"],
+                          max_power=battery_dict["max_power"],
+                          energy=battery_dict["nominal_energy"],
+                          soh=0.8,
+                          efficiency=battery_dict["rech_eff"],
+                          nominal_voltage=battery_dict["nominal_voltage"])
+    assert battery.snapshot.state.internal.electric_energy_stored == battery.max_energy
+    assert battery.soc == 1.0
+
+def test_battery_invalidate_cache() -> None:
+    battery = create_rechargeable_battery()
+    battery.nominal_energy *= 2
+    battery.invalidate_cache()
+    assert battery.max_energy == battery_dict["nominal_energy"] * 2 * battery.soh
+    assert not battery.is_full
+    battery.system_mass += 10.0
+    battery.invalidate_cache()
+    assert battery.total_mass == battery.system_mass
@@ -0,0 +1,123 @@
+"""This module contains test routines for the energy source batch functions."""
+
+import numpy as np
+from components.battery import LiCoBattery, AlAirBattery
+from components.energy_source_batch import BatteryPack, pack_batteries, unpack_batteries, \
+    batch_update_charge, batch_energy_trajectory, energy_trajectory
+from components.energy_source import BatteryNonRechargeable
+from components.consumption import return_non_rechargeable_battery_consumption
+
+delta_t: float = 1.0
+
+
+def create_fleet() -> list:
+    non_rechargeable = BatteryNonRechargeable(
+        name="Test non rechargeable battery",
+        nominal_energy=1_000.0,
+        max_power=200.0,
+        energy=100.0,
+        battery_mass=10.0,
+        soh=1.0,
+        efficiency=return_non_rechargeable_battery_consumption(
+            discharge_efficiency_func=lambda s: 0.9),
+        nominal_voltage=12.0)
+    full = LiCoBattery(name="Full battery", nominal_energy=1_000.0,
+                       max_power=200.0, energy=990.0, nominal_voltage=12.0)
+    half = AlAirBattery(name="Half battery", nominal_energy=2_000.0,
+                        max_power=200.0, energy=1_000.0, nominal_voltage=24.0)
+    non_rechargeable.snapshot.io.output_port.electric_power = 150.0
+    full.snapshot.io.input_port.electric_power = 50.0
+    half.snapshot.io.input_port.electric_power = 20.0
+    half.snapshot.io.output_port.electric_power = 120.0
+    return [non_rechargeable, full, half]
+
+def test_batch_update_charge() -> None:
+    batteries, reference = create_fleet(), create_fleet()
+    energy, max_energy, power_in, power_out = pack_batteries(batteries)
+    batch_update_charge(energy, max_energy, power_in, power_out, delta_t)
+    unpack_batteries(batteries, energy)
+    for battery, expected in zip(batteries, reference):
+        expected.update_charge(delta_t=delta_t)
+        assert battery.snapshot.state.internal.electric_energy_stored == \
+            expected.snapshot.state.internal.electric_energy_stored
+
+def test_battery_pack() -> None:
+    batteries, reference = create_fleet(), create_fleet()
+    pack = BatteryPack(batteries=batteries)
+    for _ in range(3):
+        pack.update_charge(delta_t=delta_t)
+        for battery in reference:
+            battery.update_charge(delta_t=delta_t)
+    assert pack.total_energy == sum(battery.snapshot.state.internal.electric_energy_stored
+                                    for battery in reference)
+    pack.store()
+    for battery, expected in zip(batteries, reference):
+        assert battery.soc == expected.soc
+        assert pack.energy_of(battery.id) == battery.snapshot.state.internal.electric_energy_stored
+    assert list(pack.temperature) == [battery.snapshot.state.internal.temperature
+                                      for battery in batteries]
+
+def test_battery_pack_masks() -> None:
+    batteries = create_fleet()
+    pack = BatteryPack(batteries=batteries)
+    pack.update_charge(delta_t=delta_t)
+    pack.store()
+    assert list(pack.empty_mask) == [battery.is_empty for battery in batteries]
+    assert list(pack.full_mask) == [battery.is_full for battery in batteries]
+    assert list(pack.full_mask) == [False, True, False]
+
+def test_batch_energy_trajectory() -> None:
+    initial_energy = [100.0, 990.0, 1_000.0]
+    max_energy = [1_000.0, 1_000.0, 2_000.0]
+    net_power = np.array([[-150.0, 50.0, -100.0],
+                          [-150.0, -500.0, 2_000.0],
+                          [300.0, 80.0, -10.0]])
+    steps = [1.0, 0.5, 2.0]
+    trajectory = batch_energy_trajectory(initial_energy=initial_energy,
+                                         max_energy=max_energy,
+                                         net_power=net_power,
+                                         delta_t=steps,
+                                         dtype=np.float64)
+    assert trajectory.shape == (4, 3)
+    for column in range(3):
+        expected = energy_trajectory(initial_energy=initial_energy[column],
+                                     max_energy=max_energy[column],
+                                     net_power=net_power[:, column],
+                                     delta_t=steps,
+                                     dtype=np.float64)
+        assert np.array_equal(trajectory[:, column], expected)
+
+def test_battery_pack_simulate_cycle() -> None:
+    pack = BatteryPack(batteries=create_fleet())
+    energy_before = pack.energy.copy()
+    power_out = np.tile(pack.power_out, (5, 1))
+    power_in = np.tile(pack.power_in, (5, 1))
+    soc, energy = pack.simulate_cycle(power_out=power_out,
+                                      delta_t=delta_t,
+                                      power_in=power_in,
+                                      dtype=np.float64)
+    assert np.array_equal(pack.energy, energy_before)
+    for k in range(1, 6):
+        pack.update_charge(delta_t=delta_t)
+        assert np.array_equal(energy[k], pack.energy)
+        assert np.allclose(soc[k], pack.soc)
+
+def test_battery_pack_register() -> None:
+    fleet = create_fleet()
+    pack = BatteryPack(batteries=fleet[:2])
+    pack.update_charge(delta_t=delta_t)
+    energy_before = pack.energy.copy()
+    row = pack.register(fleet[2])
+    assert row == 2 and pack.index[fleet[2].id] == 2
+    assert np.array_equal(pack.energy[:2], energy_before)
+    assert pack.energy_of(fleet[2].id) == fleet[2].snapshot.state.internal.electric_energy_stored
+    assert pack.power_out.size == pack.temperature.size == 3
+
+def test_battery_pack_step() -> None:
+    batteries, reference = create_fleet(), create_fleet()
+    pack = BatteryPack(batteries=batteries)
+    soc = pack.step(delta_t=delta_t)
+    for row, battery in enumerate(reference):
+        battery.update_charge(delta_t=delta_t)
+        assert abs(soc[row] - battery.soc) < 1e-12
+    assert pack.total_mass == sum(battery.total_mass for battery in reference)
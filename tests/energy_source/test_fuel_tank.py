@@ -1,7 +1,13 @@
 """This module contains test routines for the EnergySource class."""
 
+import copy
+import pickle
+from math import isclose
+from dataclasses import FrozenInstanceError
 from typing import TypedDict
-from components.fuel_tank import LIQUID_FUEL_TANKS, GASEOUS_FUEL_TANKS
+from components.energy_source import EnergySource
+from components.fuel_tank import LIQUID_FUEL_TANKS, GASEOUS_FUEL_TANKS, GasolineTank
+from components.fuel_type import GASOLINE, Gasoline
 
 
 class TestLiquidFuelTankParams(TypedDict):
@@ -50,3 +56,121 @@ def test_create_gaseous_fuel_tanks() -> None:
                    fuel_mass=gaseous_tank_dict["fuel_mass"],
                    tank_mass=gaseous_tank_dict["tank_mass"])
         assert isinstance(lft, tank)
+
+def test_liquid_fuel_tanks_mass_and_energy() -> None:
+    for tank in LIQUID_FUEL_TANKS:
+        lft = tank(name="Test liquid fuel tank",
+                   capacity_liters=liquid_tank_dict["capacity_liters"],
+                   liters=liquid_tank_dict["liters"],
+                   tank_mass=liquid_tank_dict["tank_mass"])
+        fuel_mass = amount / 1_000 * lft.fuel.mass_density
+        assert abs(lft.fuel_mass - fuel_mass) < 1e-9
+        assert abs(lft.max_energy - fuel_mass * lft.fuel.energy_density) < 1e-3
+        assert abs(lft.total_mass - (tank_mass + fuel_mass)) < 1e-9
+
+def test_gaseous_fuel_tanks_mass_and_energy() -> None:
+    for tank in GASEOUS_FUEL_TANKS:
+        gft = tank(name="Test gaseous fuel tank",
+                   capacity_mass=gaseous_tank_dict["capacity_mass"],
+                   fuel_mass=gaseous_tank_dict["fuel_mass"],
+                   tank_mass=gaseous_tank_dict["tank_mass"])
+        assert gft.fuel_mass == amount
+        assert gft.max_energy == amount * gft.fuel.energy_density
+        assert gft.total_mass == tank_mass + amount
+
+def test_fuel_tanks_identity_equality() -> None:
+    tank = LIQUID_FUEL_TANKS[0]
+    first, second = (tank(name="Test liquid fuel tank",
+                          capacity_liters=liquid_tank_dict["capacity_liters"],
+                          liters=liquid_tank_dict["liters"],
+                          tank_mass=liquid_tank_dict["tank_mass"]) for _ in range(2))
+    assert first == first and first != second
+    assert len({first, second}) == 2
+
+def test_fuel_tanks_slots() -> None:
+    for tank in LIQUID_FUEL_TANKS:
+        assert not hasattr(tank(name="Test liquid fuel tank",
+                                capacity_liters=liquid_tank_dict["capacity_liters"],
+                                liters=liquid_tank_dict["liters"],
+                                tank_mass=liquid_tank_dict["tank_mass"]), "__dict__")
+    for tank in GASEOUS_FUEL_TANKS:
+        assert not hasattr(tank(name="Test gaseous fuel tank",
+                                capacity_mass=gaseous_tank_dict["capacity_mass"],
+                                fuel_mass=gaseous_tank_dict["fuel_mass"],
+                                tank_mass=gaseous_tank_dict["tank_mass"]), "__dict__")
+
+def test_fuel_tanks_store_fuel() -> None:
+    for tank in GASEOUS_FUEL_TANKS:
+        gft = tank(name="Test gaseous fuel tank",
+                   capacity_mass=gaseous_tank_dict["capacity_mass"],
+                   fuel_mass=gaseous_tank_dict["fuel_mass"],
+                   tank_mass=gaseous_tank_dict["tank_mass"])
+        assert gft.stores_fuel
+
+def test_fuel_tanks_pickle_round_trip() -> None:
+    for tank in LIQUID_FUEL_TANKS:
+        lft = tank(name="Test liquid fuel tank",
+                   capacity_liters=liquid_tank_dict["capacity_liters"],
+                   liters=liquid_tank_dict["liters"],
+                   tank_mass=liquid_tank_dict["tank_mass"])
+        copy = pickle.loads(pickle.dumps(lft))
+        assert copy.id == lft.id and copy.fuel_mass == lft.fuel_mass
+        assert copy._internal is copy.snapshot.state.internal
+
+def test_fuel_tanks_share_fuel_instances() -> None:
+    first = GasolineTank(name="First", capacity_liters=50.0, liters=10.0, tank_mass=5.0)
+    second = GasolineTank(name="Second", capacity_liters=60.0, liters=20.0, tank_mass=6.0)
+    assert first.fuel is second.fuel is GASOLINE
+
+def test_fuels_are_hashable() -> None:
+    tanks = {GASOLINE: "tank"}
+    assert tanks[GASOLINE] == "tank"
+    assert Gasoline() == GASOLINE and hash(Gasoline()) == hash(GASOLINE)
+    try:
+        GASOLINE.energy_density *= 2  # type: ignore
+    except FrozenInstanceError:
+        pass
+    assert GASOLINE in tanks
+
+def test_fuels_are_immutable() -> None:
+    for attribute in ("energy_density", "mass_density", "is_liquid",
+                      "_energy_per_liter"):
+        try:
+            setattr(GASOLINE, attribute, 1.0)
+        except FrozenInstanceError:
+            continue
+        assert False, f"'{attribute}' could be reassigned"
+    tank = GasolineTank(name="Tank", capacity_liters=50.0, liters=10.0, tank_mass=5.0)
+    assert isclose(tank.max_energy, GASOLINE.energy_per_liter(liters=10.0))
+
+def test_fuels_are_slotted() -> None:
+    assert not hasattr(GASOLINE, "__dict__")
+    assert GASOLINE.is_liquid and not GASOLINE.is_gaseous
+    assert abs(GASOLINE.energy_per_liter(liters=1.0)
+               - GASOLINE.mass_density * GASOLINE.energy_density / 1_000.0) < 1e-6
+
+def test_fuel_energy_arrays() -> None:
+    amounts = [0.0, 0.5, 12.0, 40.0]
+    assert GASOLINE.energy_per_liter_array(amounts).tolist() == \
+        [GASOLINE.energy_per_liter(liters=amount) for amount in amounts]
+    assert GASOLINE.energy_per_kg_array(amounts).tolist() == \
+        [GASOLINE.energy_per_kg(mass=amount) for amount in amounts]
+
+def test_energy_source_copy_and_pickle() -> None:
+    tank = GasolineTank(name="Tank", capacity_liters=50.0, liters=10.0, tank_mass=5.0)
+    source = EnergySource(name="Generic source",
+                          input=None,
+                          output=tank.output,
+                          system_mass=1.0,
+                          snapshot=tank.snapshot)
+    for original in (source, tank):
+        for clone in (copy.deepcopy(original), pickle.loads(pickle.dumps(original))):
+            assert type(clone) is type(original)
+            assert clone.id == original.id and clone.name == original.name
+            assert clone.system_mass == original.system_mass
+            assert clone.energy_medium == original.energy_medium
+            assert clone.snapshot.state.internal.liters_stored == \
+                original.snapshot.state.internal.liters_stored
+    clone = copy.deepcopy(tank)
+    assert clone._internal is clone.snapshot.state.internal
+    assert clone.fuel_mass == tank.fuel_mass
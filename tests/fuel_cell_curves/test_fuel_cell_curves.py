@@ -0,0 +1,33 @@
+"""This module contains test routines for the fuel cell curves."""
+
+import numpy as np
+from components.component_snapshot import return_fuel_cell_snapshot
+from components.fuel_cell_curves import FuelCellEfficiencyCurves
+from components.fuel_type import HYDROGEN_GAS
+
+curve_params = {"min_power": 0.0,
+                "min_power_eff": 0.075,
+                "power_peak_eff": 10_000.0,
+                "peak_eff": 0.50,
+                "max_power": 20_000.0,
+                "max_power_eff": 0.375}
+
+
+def test_gaussian_efficiency() -> None:
+    curve = FuelCellEfficiencyCurves.gaussian(**curve_params)
+    for power, expected in ((0.0, 0.075), (10_000.0, 0.5), (20_000.0, 0.375)):
+        snap = return_fuel_cell_snapshot(fuel_in=HYDROGEN_GAS,
+                                         electric_power_out=power)
+        assert abs(curve(snap) - expected) < 1e-12
+    snap = return_fuel_cell_snapshot(fuel_in=HYDROGEN_GAS,
+                                     electric_power_out=25_000.0)
+    assert curve(snap) == 0.0
+
+def test_gaussian_batch_efficiency() -> None:
+    curve = FuelCellEfficiencyCurves.gaussian(**curve_params)
+    batch = FuelCellEfficiencyCurves.gaussian_batch(**curve_params)
+    powers = [0.0, 2_500.0, 10_000.0, 12_345.0, 20_000.0, 25_000.0]
+    expected = [curve(return_fuel_cell_snapshot(fuel_in=HYDROGEN_GAS,
+                                                electric_power_out=power))
+                for power in powers]
+    assert np.allclose(batch(powers), expected, rtol=1e-15, atol=0.0)